@@ -14,7 +14,15 @@ from lestash.core.database import (
     remove_tag,
 )
 from lestash.core.embeddings import re_embed_item
-from lestash.core.enrichment import get_author_actor, get_item_subtype, get_preview
+from lestash.core.enrichment import (
+    PostCache,
+    ProfileCache,
+    get_author_actor,
+    get_item_subtype,
+    get_preview,
+    prefetch_post_cache,
+    prefetch_profiles,
+)
 from lestash.models.item import Item
 
 from lestash_server.deps import get_db
@@ -53,9 +61,18 @@ def _media_responses(conn, item_id: int) -> list[MediaResponse]:
     ]
 
 
-def _enrich_item(conn, item: Item) -> ItemResponse:
-    """Convert an Item to an enriched API response."""
-    author_display, actor_display = get_author_actor(conn, item)
+def _enrich_item(
+    conn,
+    item: Item,
+    profile_cache: ProfileCache | None = None,
+    post_cache: PostCache | None = None,
+) -> ItemResponse:
+    """Convert an Item to an enriched API response.
+
+    Callers enriching several items pass shared profile/post caches so each
+    author and reaction target is looked up once per request.
+    """
+    author_display, actor_display = get_author_actor(conn, item, profile_cache, post_cache)
     child_count = conn.execute(
         "SELECT COUNT(*) FROM items WHERE parent_id = ?", (item.id,)
     ).fetchone()[0]
@@ -75,13 +92,21 @@ def _enrich_item(conn, item: Item) -> ItemResponse:
         subtype=get_item_subtype(item),
         author_display=author_display,
         actor_display=actor_display,
-        preview=get_preview(conn, item, max_length=120),
+        preview=get_preview(conn, item, max_length=120, post_cache=post_cache),
         tags=get_tags(conn, item.id),
         child_count=child_count,
         media=_media_responses(conn, item.id),
     )
 
 
+def _enrich_items(conn, rows) -> list[ItemResponse]:
+    """Enrich a page of item rows, batch-loading their profiles and targets."""
+    items = [Item.from_row(row) for row in rows]
+    profile_cache = prefetch_profiles(conn, items)
+    post_cache = prefetch_post_cache(conn, items)
+    return [_enrich_item(conn, item, profile_cache, post_cache) for item in items]
+
+
 def _matches_exclude(subtype: str, excludes: set[str]) -> bool:
     """Check if a subtype matches any exclude term."""
     return any(ex in subtype for ex in excludes)
@@ -162,7 +187,7 @@ def list_items(
             params.extend([fetch_limit, offset])
 
             rows = conn.execute(query, params).fetchall()
-            all_enriched = [_enrich_item(conn, Item.from_row(row)) for row in rows]
+            all_enriched = _enrich_items(conn, rows)
             items = [i for i in all_enriched if not _matches_exclude(i.subtype, excludes)]
 
             # Adjust total to reflect filtering (approximate)
@@ -175,7 +200,7 @@ def list_items(
             query += " LIMIT ? OFFSET ?"
             params.extend([limit, offset])
             rows = conn.execute(query, params).fetchall()
-            items = [_enrich_item(conn, Item.from_row(row)) for row in rows]
+            items = _enrich_items(conn, rows)
 
     return ItemListResponse(items=items, total=total, limit=limit, offset=offset)
 
@@ -267,11 +292,13 @@ def search_items(
 
         # Build response
         items = []
+        profile_cache: ProfileCache = {}
+        post_cache: PostCache = {}
         for item_id in ranked_ids:
             if item_id in fts_results:
                 row = fts_results[item_id]["row"]
                 item = Item.from_row(row)
-                enriched = _enrich_item(conn, item)
+                enriched = _enrich_item(conn, item, profile_cache, post_cache)
                 snippet = fts_results[item_id]["snippet"]
                 if snippet:
                     enriched.preview = snippet
@@ -280,7 +307,7 @@ def search_items(
                 if not row:
                     continue
                 item = Item.from_row(row)
-                enriched = _enrich_item(conn, item)
+                enriched = _enrich_item(conn, item, profile_cache, post_cache)
             items.append(enriched)
 
     return ItemListResponse(items=items, total=len(items), limit=limit, offset=0)
@@ -1,11 +1,10 @@
 """Source API endpoints."""
 
-import json
 import logging
 from datetime import datetime
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException
-from lestash.core.database import get_connection
+from lestash.core.database import get_connection, upsert_items_stream
 from lestash.plugins.loader import load_plugins
 
 from lestash_server.deps import get_config, get_db
@@ -78,40 +77,11 @@ def _run_sync(source_name: str) -> None:
         conn.commit()
 
         items_added = 0
+        items_updated = 0
         error_message = None
 
         try:
-            for item in plugin.sync(plugin_config):
-                metadata_json = json.dumps(item.metadata) if item.metadata else None
-                conn.execute(
-                    """
-                    INSERT INTO items (
-                        source_type, source_id, url, title, content,
-                        author, created_at, is_own_content, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(source_type, source_id) DO UPDATE SET
-                        url = excluded.url,
-                        title = excluded.title,
-                        content = excluded.content,
-                        author = excluded.author,
-                        is_own_content = excluded.is_own_content,
-                        metadata = excluded.metadata
-                    """,
-                    (
-                        item.source_type,
-                        item.source_id,
-                        item.url,
-                        item.title,
-                        item.content,
-                        item.author,
-                        item.created_at,
-                        item.is_own_content,
-                        metadata_json,
-                    ),
-                )
-                items_added += 1
-
-            conn.commit()
+            items_added, items_updated = upsert_items_stream(conn, plugin.sync(plugin_config))
 
             conn.execute(
                 """
@@ -136,7 +106,7 @@ def _run_sync(source_name: str) -> None:
                 error_message = ?
             WHERE id = ?
             """,
-            (datetime.now(), status, items_added, 0, error_message, sync_id),
+            (datetime.now(), status, items_added, items_updated, error_message, sync_id),
         )
         conn.commit()
 
@@ -61,6 +61,21 @@ class TestItems:
         assert "actor_display" in item
         assert "preview" in item
 
+    def test_list_items_resolves_profiles_and_cached_targets(self, client, test_config):
+        from lestash.core.database import get_connection, upsert_person_profile, upsert_post_cache
+
+        with get_connection(test_config) as conn:
+            upsert_person_profile(conn, "urn:li:person:author1", display_name="Ada")
+            upsert_post_cache(
+                conn, "urn:li:activity:123", content_preview="Cached post", author_name="Bob"
+            )
+
+        items = client.get("/api/items?source=linkedin").json()["items"]
+        by_source_id = {i["source_id"]: i for i in items}
+        assert by_source_id["li-1"]["author_display"] == "Ada"
+        assert by_source_id["li-2"]["author_display"] == "Bob"
+        assert by_source_id["li-2"]["preview"] == '👍 LIKE: "Cached post"'
+
     def test_get_item_by_id(self, client):
         # First get an item ID
         items = client.get("/api/items?limit=1").json()["items"]
@@ -431,6 +446,69 @@ class TestSources:
         assert data["source"] == "arxiv"
 
 
+class TestRunSync:
+    """Test the background sync task behind POST /api/sources/{name}/sync."""
+
+    @staticmethod
+    def _plugin(items, error=None):
+        from lestash.models.item import ItemCreate
+
+        def sync(config):
+            for source_id, content in items:
+                yield ItemCreate(source_type="fake", source_id=source_id, content=content)
+            if error:
+                raise error
+
+        plugin = MagicMock()
+        plugin.sync.side_effect = sync
+        return plugin
+
+    def _run(self, plugin):
+        from lestash_server.routes.sources import _run_sync
+
+        with patch("lestash_server.routes.sources.load_plugins", return_value={"fake": plugin}):
+            _run_sync("fake")
+
+    def test_resync_keeps_parent_link(self, client, test_config):
+        from lestash.core.database import get_connection
+
+        plugin = self._plugin([("parent", "Video"), ("child", "Transcript")])
+        self._run(plugin)
+        with get_connection(test_config) as conn:
+            conn.execute(
+                """UPDATE items SET parent_id =
+                   (SELECT id FROM items WHERE source_type = 'fake' AND source_id = 'parent')
+                   WHERE source_type = 'fake' AND source_id = 'child'"""
+            )
+            conn.commit()
+            history_before = conn.execute("SELECT COUNT(*) FROM item_history").fetchone()[0]
+
+        self._run(plugin)
+
+        with get_connection(test_config) as conn:
+            rows = dict(
+                conn.execute(
+                    "SELECT source_id, parent_id FROM items WHERE source_type = 'fake'"
+                ).fetchall()
+            )
+            history = conn.execute("SELECT COUNT(*) FROM item_history").fetchone()[0]
+        assert rows["child"] is not None
+        assert history == history_before
+
+    def test_failed_sync_keeps_items_seen_before_error(self, client, test_config):
+        from lestash.core.database import get_connection
+
+        self._run(self._plugin([("a", "one"), ("b", "two")], error=RuntimeError("boom")))
+
+        with get_connection(test_config) as conn:
+            count = conn.execute(
+                "SELECT COUNT(*) FROM items WHERE source_type = 'fake'"
+            ).fetchone()[0]
+            log = conn.execute("SELECT status, error_message FROM sync_log").fetchone()
+        assert count == 2
+        assert tuple(log) == ("failed", "boom")
+
+
 class TestProfiles:
     """Test /api/profiles endpoint."""
 
@@ -1,11 +1,12 @@
 """YouTube source plugin implementation."""
 
+import functools
 import json
 import re
 import sqlite3
 from collections.abc import Iterator
 from contextlib import suppress
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Annotated, Any
 
 import typer
@@ -34,7 +35,45 @@ from lestash_youtube.client import (
 console = Console()
 logger = get_plugin_logger("youtube")
 
+# ISO 8601 duration: PT[nH][nM][nS]
+_DURATION_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?")
 
+# The common YouTube API timestamp shape: YYYY-MM-DDTHH:MM:SSZ
+_UTC_TIMESTAMP_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})Z$")
+
+# Thumbnail qualities in order of preference (largest first)
+_VIDEO_THUMB_PREF = ("maxres", "standard", "high", "medium", "default")
+_SUBSCRIPTION_THUMB_PREF = ("high", "medium", "default")
+
+# Optional video fields copied into metadata when present
+_VIDEO_STAT_KEYS = ("view_count", "like_count", "comment_count")
+_VIDEO_ACTION_KEYS = ("liked_at", "watched_at")
+
+
+def _best_thumbnail_url(thumbnails: dict[str, Any], preference: tuple[str, ...]) -> str | None:
+    """Return the URL of the first available thumbnail in ``preference`` order."""
+    return next((thumbnails[q].get("url") for q in preference if q in thumbnails), None)
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    """Parse an API timestamp into an aware datetime, or None if invalid.
+
+    Plain ``...Z`` timestamps are built directly from the regex groups; any
+    other shape (fractional seconds, explicit offsets) goes through
+    ``datetime.fromisoformat``.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    match = _UTC_TIMESTAMP_RE.match(value)
+    with suppress(ValueError):
+        if match:
+            year, month, day, hour, minute, second = map(int, match.groups())
+            return datetime(year, month, day, hour, minute, second, tzinfo=UTC)
+        return datetime.fromisoformat(value)
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_iso8601_duration(duration: str | None) -> int | None:
     """Parse ISO 8601 duration string to seconds.
 
@@ -47,10 +86,7 @@ def parse_iso8601_duration(duration: str | None) -> int | None:
     if not duration:
         return None
 
-    # Pattern for ISO 8601 duration: PT[nH][nM][nS]
-    pattern = r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?"
-    match = re.match(pattern, duration)
-
+    match = _DURATION_RE.match(duration)
     if not match:
         return None
 
@@ -79,17 +115,11 @@ def video_to_item(
     # For liked videos, use liked_at as the item's created_at
     # For history, use watched_at
     # Fall back to published_at if neither is available
-    created_at = None
-    action_timestamp = video.get("liked_at") or video.get("watched_at")
-
-    if action_timestamp:
-        with suppress(ValueError, AttributeError):
-            created_at = datetime.fromisoformat(action_timestamp.replace("Z", "+00:00"))
+    created_at = _parse_timestamp(video.get("liked_at") or video.get("watched_at"))
 
     # Fall back to published_at if no action timestamp
-    if created_at is None and video.get("published_at"):
-        with suppress(ValueError, AttributeError):
-            created_at = datetime.fromisoformat(video["published_at"].replace("Z", "+00:00"))
+    if created_at is None:
+        created_at = _parse_timestamp(video.get("published_at"))
 
     # Build YouTube URL
     video_id = video.get("id")
@@ -99,15 +129,12 @@ def video_to_item(
     duration_seconds = parse_iso8601_duration(video.get("duration"))
 
     # Get best thumbnail URL
-    thumbnails = video.get("thumbnails", {})
-    thumbnail_url = None
-    for quality in ["maxres", "high", "medium", "default"]:
-        if quality in thumbnails:
-            thumbnail_url = thumbnails[quality].get("url")
-            break
-
-    # Build metadata
-    metadata = {
+    thumbnail_url = _best_thumbnail_url(video.get("thumbnails") or {}, _VIDEO_THUMB_PREF)
+
+    # Build metadata in one pass; statistics and timestamps are only stored
+    # when the API returned them. Key order is part of the stored JSON, so it
+    # must stay stable or every re-sync records a spurious history row.
+    metadata: dict[str, Any] = {
         "video_id": video_id,
         "channel_id": video.get("channel_id"),
         "channel_title": video.get("channel_title"),
@@ -118,26 +145,11 @@ def video_to_item(
         "thumbnail_url": thumbnail_url,
         "tags": video.get("tags", []),
         "category_id": video.get("category_id"),
+        **({"published_at": video["published_at"]} if video.get("published_at") else {}),
+        **{key: int(video[key]) for key in _VIDEO_STAT_KEYS if video.get(key)},
+        **{key: video[key] for key in _VIDEO_ACTION_KEYS if video.get(key)},
     }
 
-    # Store original video publish date in metadata
-    if video.get("published_at"):
-        metadata["published_at"] = video["published_at"]
-
-    # Add statistics if available
-    if video.get("view_count"):
-        metadata["view_count"] = int(video["view_count"])
-    if video.get("like_count"):
-        metadata["like_count"] = int(video["like_count"])
-    if video.get("comment_count"):
-        metadata["comment_count"] = int(video["comment_count"])
-
-    # Store action timestamps in metadata
-    if video.get("liked_at"):
-        metadata["liked_at"] = video["liked_at"]
-    if video.get("watched_at"):
-        metadata["watched_at"] = video["watched_at"]
-
     # Preserve a user note from a share capture
     if note:
         metadata["notes"] = note
@@ -169,20 +181,14 @@ def subscription_to_item(subscription: dict[str, Any]) -> ItemCreate:
     Returns:
         ItemCreate object for storage
     """
-    created_at = None
-    if subscription.get("published_at"):
-        with suppress(ValueError, AttributeError):
-            created_at = datetime.fromisoformat(subscription["published_at"].replace("Z", "+00:00"))
+    created_at = _parse_timestamp(subscription.get("published_at"))
 
     channel_id = subscription.get("channel_id")
     url = f"https://www.youtube.com/channel/{channel_id}" if channel_id else None
 
-    thumbnails = subscription.get("thumbnails", {})
-    thumbnail_url = None
-    for quality in ["high", "medium", "default"]:
-        if quality in thumbnails:
-            thumbnail_url = thumbnails[quality].get("url")
-            break
+    thumbnail_url = _best_thumbnail_url(
+        subscription.get("thumbnails") or {}, _SUBSCRIPTION_THUMB_PREF
+    )
 
     metadata = {
         "subscription_id": subscription.get("id"),
@@ -367,10 +373,7 @@ def comment_to_item(
     Returns:
         ItemCreate for the comment.
     """
-    created_at = None
-    if comment.get("published_at"):
-        with suppress(ValueError, AttributeError):
-            created_at = datetime.fromisoformat(comment["published_at"].replace("Z", "+00:00"))
+    created_at = _parse_timestamp(comment.get("published_at"))
 
     return ItemCreate(
         source_type="youtube",
@@ -1,19 +1,52 @@
 """Tests for YouTube CLI commands."""
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import pytest
+from lestash.core import database as core_database
+from lestash.core.config import Config
+from lestash_youtube import source as yt_source
 from lestash_youtube.source import YouTubeSource
 from typer.testing import CliRunner
 
 runner = CliRunner()
 
+# The plugin is stateless, so one instance (and one CLI app) serves every test
+_SOURCE = YouTubeSource()
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def youtube_app():
     """Get the YouTube CLI app."""
-    source = YouTubeSource()
-    return source.get_commands()
+    return _SOURCE.get_commands()
+
+
+class _DummyConnection:
+    """Minimal stand-in for a sqlite3 connection used by the sync command."""
+
+    def execute(self, *args, **kwargs):
+        return SimpleNamespace(rowcount=1)
+
+    def commit(self):
+        pass
+
+
+@pytest.fixture
+def dummy_conn_cm():
+    """Context manager yielding a dummy connection, for patching get_connection."""
+
+    class _ConnectionContext:
+        def __init__(self):
+            self.conn = _DummyConnection()
+
+        def __enter__(self):
+            return self.conn
+
+        def __exit__(self, *exc):
+            return None
+
+    return _ConnectionContext()
 
 
 class TestAuthCommand:
@@ -21,8 +54,8 @@ class TestAuthCommand:
 
     def test_auth_fails_without_client_secrets(self, youtube_app):
         """Should fail with helpful message when client secrets not found."""
-        with patch("lestash_youtube.source.check_client_secrets", return_value=False):
-            result = runner.invoke(youtube_app, ["auth"])
+        with patch.object(yt_source, "check_client_secrets", return_value=False):
+            result = runner.invoke(youtube_app, ["auth"], catch_exceptions=False)
 
         assert result.exit_code == 1
         assert "OAuth client secrets not found" in result.output
@@ -33,13 +66,14 @@ class TestAuthCommand:
         mock_creds = MagicMock()
         mock_channel = {"title": "Test Channel", "custom_url": "@testchannel"}
 
-        with (
-            patch("lestash_youtube.source.check_client_secrets", return_value=True),
-            patch("lestash_youtube.source.run_oauth_flow", return_value=mock_creds),
-            patch("lestash_youtube.source.create_youtube_client"),
-            patch("lestash_youtube.source.get_channel_info", return_value=mock_channel),
+        with patch.multiple(
+            yt_source,
+            check_client_secrets=MagicMock(return_value=True),
+            run_oauth_flow=MagicMock(return_value=mock_creds),
+            create_youtube_client=DEFAULT,
+            get_channel_info=MagicMock(return_value=mock_channel),
         ):
-            result = runner.invoke(youtube_app, ["auth"])
+            result = runner.invoke(youtube_app, ["auth"], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "Authentication successful" in result.output
@@ -51,19 +85,20 @@ class TestStatusCommand:
 
     def test_status_fails_without_client_secrets(self, youtube_app):
         """Should fail when client secrets not found."""
-        with patch("lestash_youtube.source.check_client_secrets", return_value=False):
-            result = runner.invoke(youtube_app, ["status"])
+        with patch.object(yt_source, "check_client_secrets", return_value=False):
+            result = runner.invoke(youtube_app, ["status"], catch_exceptions=False)
 
         assert result.exit_code == 1
         assert "Not found" in result.output
 
     def test_status_fails_without_credentials(self, youtube_app):
         """Should fail when not authenticated."""
-        with (
-            patch("lestash_youtube.source.check_client_secrets", return_value=True),
-            patch("lestash_youtube.source.load_credentials", return_value=None),
+        with patch.multiple(
+            yt_source,
+            check_client_secrets=MagicMock(return_value=True),
+            load_credentials=MagicMock(return_value=None),
         ):
-            result = runner.invoke(youtube_app, ["status"])
+            result = runner.invoke(youtube_app, ["status"], catch_exceptions=False)
 
         assert result.exit_code == 1
         assert "Not found" in result.output
@@ -79,13 +114,14 @@ class TestStatusCommand:
             "view_count": "100000",
         }
 
-        with (
-            patch("lestash_youtube.source.check_client_secrets", return_value=True),
-            patch("lestash_youtube.source.load_credentials", return_value=mock_creds),
-            patch("lestash_youtube.source.create_youtube_client"),
-            patch("lestash_youtube.source.get_channel_info", return_value=mock_channel),
+        with patch.multiple(
+            yt_source,
+            check_client_secrets=MagicMock(return_value=True),
+            load_credentials=MagicMock(return_value=mock_creds),
+            create_youtube_client=DEFAULT,
+            get_channel_info=MagicMock(return_value=mock_channel),
         ):
-            result = runner.invoke(youtube_app, ["status"])
+            result = runner.invoke(youtube_app, ["status"], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "Connected" in result.output
@@ -97,13 +133,13 @@ class TestSyncCommand:
 
     def test_sync_fails_without_credentials(self, youtube_app):
         """Should fail when not authenticated."""
-        with patch("lestash_youtube.source.load_credentials", return_value=None):
-            result = runner.invoke(youtube_app, ["sync"])
+        with patch.object(yt_source, "load_credentials", return_value=None):
+            result = runner.invoke(youtube_app, ["sync"], catch_exceptions=False)
 
         assert result.exit_code == 1
         assert "Not authenticated" in result.output
 
-    def test_sync_fetches_liked_videos(self, youtube_app):
+    def test_sync_fetches_liked_videos(self, youtube_app, dummy_conn_cm):
         """Should sync liked videos by default."""
         mock_creds = MagicMock()
         mock_videos = [
@@ -125,71 +161,63 @@ class TestSyncCommand:
             }
         ]
 
-        # Create mock connection context manager
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_cursor.rowcount = 1
-        mock_conn.execute.return_value = mock_cursor
-
         with (
-            patch("lestash_youtube.source.load_credentials", return_value=mock_creds),
-            patch("lestash_youtube.source.create_youtube_client"),
-            patch("lestash_youtube.source.get_liked_videos", return_value=mock_videos),
-            patch("lestash_youtube.source.get_watch_history", return_value=[]),
-            patch("lestash.core.config.Config.load") as mock_config,
-            patch("lestash.core.database.get_connection") as mock_get_conn,
+            patch.multiple(
+                yt_source,
+                load_credentials=MagicMock(return_value=mock_creds),
+                create_youtube_client=DEFAULT,
+                get_liked_videos=MagicMock(return_value=mock_videos),
+                get_watch_history=MagicMock(return_value=[]),
+            ),
+            patch.object(Config, "load"),
+            patch.object(core_database, "get_connection", return_value=dummy_conn_cm),
         ):
-            mock_config.return_value = MagicMock()
-            mock_get_conn.return_value.__enter__ = MagicMock(return_value=mock_conn)
-            mock_get_conn.return_value.__exit__ = MagicMock(return_value=None)
-
-            result = runner.invoke(youtube_app, ["sync"])
+            result = runner.invoke(youtube_app, ["sync"], catch_exceptions=False)
 
         assert result.exit_code == 0
-        assert "liked videos" in result.output.lower()
+        output = result.output.lower()
+        assert "liked videos" in output
 
-    def test_sync_shows_history_warning(self, youtube_app):
+    def test_sync_shows_history_warning(self, youtube_app, dummy_conn_cm):
         """Should show warning when history is empty."""
         mock_creds = MagicMock()
-        mock_conn = MagicMock()
 
         with (
-            patch("lestash_youtube.source.load_credentials", return_value=mock_creds),
-            patch("lestash_youtube.source.create_youtube_client"),
-            patch("lestash_youtube.source.get_liked_videos", return_value=[]),
-            patch("lestash_youtube.source.get_watch_history", return_value=[]),
-            patch("lestash.core.config.Config.load") as mock_config,
-            patch("lestash.core.database.get_connection") as mock_get_conn,
+            patch.multiple(
+                yt_source,
+                load_credentials=MagicMock(return_value=mock_creds),
+                create_youtube_client=DEFAULT,
+                get_liked_videos=MagicMock(return_value=[]),
+                get_watch_history=MagicMock(return_value=[]),
+            ),
+            patch.object(Config, "load"),
+            patch.object(core_database, "get_connection", return_value=dummy_conn_cm),
         ):
-            mock_config.return_value = MagicMock()
-            mock_get_conn.return_value.__enter__ = MagicMock(return_value=mock_conn)
-            mock_get_conn.return_value.__exit__ = MagicMock(return_value=None)
+            result = runner.invoke(youtube_app, ["sync"], catch_exceptions=False)
 
-            result = runner.invoke(youtube_app, ["sync"])
-
-        assert "restricted" in result.output.lower() or "empty" in result.output.lower()
+        assert result.exit_code == 0
+        output = result.output.lower()
+        assert "restricted" in output or "empty" in output
 
-    def test_sync_respects_no_history_flag(self, youtube_app):
+    def test_sync_respects_no_history_flag(self, youtube_app, dummy_conn_cm):
         """Should skip history sync when --no-history is passed."""
         mock_creds = MagicMock()
-        mock_conn = MagicMock()
 
         with (
-            patch("lestash_youtube.source.load_credentials", return_value=mock_creds),
-            patch("lestash_youtube.source.create_youtube_client"),
-            patch("lestash_youtube.source.get_liked_videos", return_value=[]),
-            patch("lestash_youtube.source.get_watch_history") as mock_history,
-            patch("lestash.core.config.Config.load") as mock_config,
-            patch("lestash.core.database.get_connection") as mock_get_conn,
+            patch.multiple(
+                yt_source,
+                load_credentials=MagicMock(return_value=mock_creds),
+                create_youtube_client=DEFAULT,
+                get_liked_videos=MagicMock(return_value=[]),
+                get_watch_history=DEFAULT,
+            ) as mocks,
+            patch.object(Config, "load"),
+            patch.object(core_database, "get_connection", return_value=dummy_conn_cm),
         ):
-            mock_config.return_value = MagicMock()
-            mock_get_conn.return_value.__enter__ = MagicMock(return_value=mock_conn)
-            mock_get_conn.return_value.__exit__ = MagicMock(return_value=None)
-
-            runner.invoke(youtube_app, ["sync", "--no-history"])
+            runner.invoke(youtube_app, ["sync", "--no-history"], catch_exceptions=False)
 
         # get_watch_history should not be called
-        mock_history.assert_not_called()
+        mocks["get_watch_history"].assert_not_called()
 
 
 class TestLikesCommand:
@@ -197,8 +225,8 @@ class TestLikesCommand:
 
     def test_likes_fails_without_credentials(self, youtube_app):
         """Should fail when not authenticated."""
-        with patch("lestash_youtube.source.load_credentials", return_value=None):
-            result = runner.invoke(youtube_app, ["likes"])
+        with patch.object(yt_source, "load_credentials", return_value=None):
+            result = runner.invoke(youtube_app, ["likes"], catch_exceptions=False)
 
         assert result.exit_code == 1
         assert "Not authenticated" in result.output
@@ -216,12 +244,13 @@ class TestLikesCommand:
             }
         ]
 
-        with (
-            patch("lestash_youtube.source.load_credentials", return_value=mock_creds),
-            patch("lestash_youtube.source.create_youtube_client"),
-            patch("lestash_youtube.source.get_liked_videos", return_value=mock_videos),
+        with patch.multiple(
+            yt_source,
+            load_credentials=MagicMock(return_value=mock_creds),
+            create_youtube_client=DEFAULT,
+            get_liked_videos=MagicMock(return_value=mock_videos),
         ):
-            result = runner.invoke(youtube_app, ["likes"])
+            result = runner.invoke(youtube_app, ["likes"], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "Great Video Title" in result.output
@@ -233,8 +262,8 @@ class TestHistoryCommand:
 
     def test_history_fails_without_credentials(self, youtube_app):
         """Should fail when not authenticated."""
-        with patch("lestash_youtube.source.load_credentials", return_value=None):
-            result = runner.invoke(youtube_app, ["history"])
+        with patch.object(yt_source, "load_credentials", return_value=None):
+            result = runner.invoke(youtube_app, ["history"], catch_exceptions=False)
 
         assert result.exit_code == 1
         assert "Not authenticated" in result.output
@@ -243,15 +272,17 @@ class TestHistoryCommand:
         """Should show Takeout instructions when history is empty."""
         mock_creds = MagicMock()
 
-        with (
-            patch("lestash_youtube.source.load_credentials", return_value=mock_creds),
-            patch("lestash_youtube.source.create_youtube_client"),
-            patch("lestash_youtube.source.get_watch_history", return_value=[]),
+        with patch.multiple(
+            yt_source,
+            load_credentials=MagicMock(return_value=mock_creds),
+            create_youtube_client=DEFAULT,
+            get_watch_history=MagicMock(return_value=[]),
         ):
-            result = runner.invoke(youtube_app, ["history"])
+            result = runner.invoke(youtube_app, ["history"], catch_exceptions=False)
 
         assert result.exit_code == 0
-        assert "takeout.google.com" in result.output.lower()
+        output = result.output.lower()
+        assert "takeout.google.com" in output
 
 
 class TestYouTubeSourcePlugin:
@@ -259,12 +290,12 @@ class TestYouTubeSourcePlugin:
 
     def test_has_correct_name(self):
         """Should have 'youtube' as name."""
-        source = YouTubeSource()
+        source = _SOURCE
         assert source.name == "youtube"
 
     def test_has_description(self):
         """Should have a description."""
-        source = YouTubeSource()
+        source = _SOURCE
         assert source.description is not None
         assert len(source.description) > 0
 
@@ -272,13 +303,13 @@ class TestYouTubeSourcePlugin:
         """Should return a Typer app from get_commands."""
         import typer
 
-        source = YouTubeSource()
+        source = _SOURCE
         app = source.get_commands()
         assert isinstance(app, typer.Typer)
 
     def test_configure_returns_defaults(self):
         """Should return default configuration."""
-        source = YouTubeSource()
+        source = _SOURCE
         config = source.configure()
 
         assert isinstance(config, dict)
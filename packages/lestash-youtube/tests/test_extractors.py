@@ -1,5 +1,8 @@
 """Tests for YouTube video extraction and transformation."""
 
+import pytest
+from lestash.core.config import Config, GeneralConfig
+from lestash.core.database import get_connection, init_database, upsert_items_batch
 from lestash.models.item import ItemCreate
 from lestash_youtube.source import (
     parse_iso8601_duration,
@@ -11,60 +14,26 @@ from lestash_youtube.source import (
 class TestParseIso8601Duration:
     """Test ISO 8601 duration parsing."""
 
-    def test_parses_hours_minutes_seconds(self):
-        """Should parse full duration with hours, minutes, and seconds."""
-        result = parse_iso8601_duration("PT1H30M45S")
-        assert result == 1 * 3600 + 30 * 60 + 45
-
-    def test_parses_minutes_and_seconds(self):
-        """Should parse duration with minutes and seconds."""
-        result = parse_iso8601_duration("PT4M35S")
-        assert result == 4 * 60 + 35
-
-    def test_parses_seconds_only(self):
-        """Should parse duration with only seconds."""
-        result = parse_iso8601_duration("PT59S")
-        assert result == 59
-
-    def test_parses_minutes_only(self):
-        """Should parse duration with only minutes."""
-        result = parse_iso8601_duration("PT10M")
-        assert result == 10 * 60
-
-    def test_parses_hours_only(self):
-        """Should parse duration with only hours."""
-        result = parse_iso8601_duration("PT2H")
-        assert result == 2 * 3600
-
-    def test_parses_hours_and_seconds(self):
-        """Should parse duration with hours and seconds, no minutes."""
-        result = parse_iso8601_duration("PT1H30S")
-        assert result == 1 * 3600 + 30
-
-    def test_returns_none_for_none_input(self):
-        """Should return None for None input."""
-        result = parse_iso8601_duration(None)
-        assert result is None
-
-    def test_returns_none_for_empty_string(self):
-        """Should return None for empty string."""
-        result = parse_iso8601_duration("")
-        assert result is None
-
-    def test_returns_none_for_invalid_format(self):
-        """Should return None for invalid duration format."""
-        result = parse_iso8601_duration("invalid")
-        assert result is None
-
-    def test_returns_none_for_missing_pt_prefix(self):
-        """Should return None when PT prefix is missing."""
-        result = parse_iso8601_duration("1H30M")
-        assert result is None
-
-    def test_parses_zero_duration(self):
-        """Should handle zero seconds."""
-        result = parse_iso8601_duration("PT0S")
-        assert result == 0
+    @pytest.mark.parametrize(
+        ("duration", "expected"),
+        [
+            ("PT1H30M45S", 1 * 3600 + 30 * 60 + 45),
+            ("PT4M35S", 4 * 60 + 35),
+            ("PT59S", 59),
+            ("PT10M", 10 * 60),
+            ("PT2H", 2 * 3600),
+            ("PT1H30S", 1 * 3600 + 30),
+            ("PT0S", 0),
+        ],
+    )
+    def test_parses_valid_duration(self, duration, expected):
+        """Should parse hours, minutes and seconds in any combination."""
+        assert parse_iso8601_duration(duration) == expected
+
+    @pytest.mark.parametrize("duration", [None, "", "invalid", "1H30M"])
+    def test_returns_none_for_invalid_input(self, duration):
+        """Should return None for missing, empty, malformed or unprefixed input."""
+        assert parse_iso8601_duration(duration) is None
 
 
 class TestVideoToItem:
@@ -154,6 +123,33 @@ class TestVideoToItem:
         assert liked_item.metadata["source_subtype"] == "liked"
         assert history_item.metadata["source_subtype"] == "history"
 
+    def test_metadata_key_order_is_stable(self, youtube_video_factory):
+        """Stored metadata JSON keeps its key order, so re-syncs match old rows."""
+        video = youtube_video_factory()
+        video["watched_at"] = "2026-01-21T09:00:00Z"
+
+        item = video_to_item(video, "liked")
+
+        assert list(item.metadata)[-6:] == [
+            "published_at",
+            "view_count",
+            "like_count",
+            "comment_count",
+            "liked_at",
+            "watched_at",
+        ]
+
+    def test_resync_creates_no_history(self, youtube_video_factory, tmp_path):
+        """Syncing the same video twice leaves no item_history rows."""
+        config = Config(general=GeneralConfig(database_path=str(tmp_path / "test.db")))
+        init_database(config)
+        video = youtube_video_factory()
+
+        with get_connection(config) as conn:
+            assert upsert_items_batch(conn, [video_to_item(video, "liked")]) == (1, 0)
+            assert upsert_items_batch(conn, [video_to_item(video, "liked")]) == (0, 1)
+            assert conn.execute("SELECT COUNT(*) FROM item_history").fetchone()[0] == 0
+
     def test_shared_subtype_and_note(self, youtube_video_factory):
         """Shared captures carry the subtype and a user note in metadata."""
         video = youtube_video_factory()
@@ -210,32 +206,23 @@ class TestVideoToItem:
         assert item.metadata["channel_id"] == "UC_test_channel"
         assert item.metadata["channel_title"] == "My Channel"
 
-    def test_stores_thumbnail_url(self, youtube_video_factory):
-        """Should store best available thumbnail URL."""
+    @pytest.mark.parametrize(
+        ("qualities", "expected"),
+        [
+            (["default", "high"], "high"),
+            (["default", "high", "maxres"], "maxres"),
+            (["high", "standard"], "standard"),
+        ],
+    )
+    def test_stores_best_thumbnail_url(self, youtube_video_factory, qualities, expected):
+        """Should store the best available thumbnail URL (maxres > standard > high)."""
         video = youtube_video_factory(
-            thumbnails={
-                "default": {"url": "https://example.com/default.jpg"},
-                "high": {"url": "https://example.com/high.jpg"},
-            }
+            thumbnails={q: {"url": f"https://example.com/{q}.jpg"} for q in qualities}
         )
 
         item = video_to_item(video, "liked")
 
-        assert item.metadata["thumbnail_url"] == "https://example.com/high.jpg"
-
-    def test_prefers_maxres_thumbnail(self, youtube_video_factory):
-        """Should prefer maxres thumbnail when available."""
-        video = youtube_video_factory(
-            thumbnails={
-                "default": {"url": "https://example.com/default.jpg"},
-                "high": {"url": "https://example.com/high.jpg"},
-                "maxres": {"url": "https://example.com/maxres.jpg"},
-            }
-        )
-
-        item = video_to_item(video, "liked")
-
-        assert item.metadata["thumbnail_url"] == "https://example.com/maxres.jpg"
+        assert item.metadata["thumbnail_url"] == f"https://example.com/{expected}.jpg"
 
     def test_stores_tags_in_metadata(self, youtube_video_factory):
         """Should store video tags."""
@@ -344,6 +331,17 @@ class TestVideoToItemEdgeCases:
 
         assert item.created_at is None
 
+    def test_parses_fractional_second_timestamp(self, youtube_video_factory):
+        """Should parse timestamps that carry fractional seconds."""
+        video = youtube_video_factory(liked_at="2026-01-20T14:00:00.250Z")
+
+        item = video_to_item(video, "liked")
+
+        assert item.created_at is not None
+        assert item.created_at.hour == 14
+        assert item.created_at.microsecond == 250000
+        assert item.created_at.utcoffset() is not None
+
     def test_handles_missing_video_id(self, youtube_video_factory):
         """Should handle missing video ID."""
         video = youtube_video_factory()
@@ -1,19 +1,44 @@
 """Config commands for Le Stash CLI."""
 
-from typing import Annotated
+import functools
+from typing import TYPE_CHECKING, Annotated, Any
 
+import tomli_w
 import typer
-from rich.console import Console
+from pydantic import BaseModel
 
 from lestash.core.config import Config, get_config_path, init_config
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 app = typer.Typer(help="Manage configuration.")
-console = Console()
+
+
+@functools.cache
+def _console() -> "Console":
+    """Create the Rich console on first use so importing this module stays cheap."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _config_sections(config: Config) -> dict[str, Any]:
+    """Read config sections straight off the models, skipping model_dump()."""
+    sections: dict[str, Any] = {}
+    for name in type(config).model_fields:
+        section = getattr(config, name)
+        if isinstance(section, BaseModel):
+            sections[name] = {key: getattr(section, key) for key in type(section).model_fields}
+        else:
+            sections[name] = section
+    return sections
 
 
 @app.command("show")
 def show_config() -> None:
     """Show current configuration."""
+    console = _console()
     config_path = get_config_path()
 
     if not config_path.exists():
@@ -25,15 +50,11 @@ def show_config() -> None:
     console.print(f"[bold]Config file:[/bold] {config_path}")
     console.print()
 
-    data = config.model_dump()
-    for section, values in data.items():
-        console.print(f"[bold][{section}][/bold]")
-        if isinstance(values, dict):
-            for key, value in values.items():
-                console.print(f"  {key} = {value}")
-        else:
-            console.print(f"  {values}")
-        console.print()
+    from rich.syntax import Syntax
+
+    # Serialize once and render in a single print rather than one per key
+    text = tomli_w.dumps(_config_sections(config))
+    console.print(Syntax(text, "toml", theme="ansi_dark", background_color="default"))
 
 
 @app.command("init")
@@ -41,6 +62,7 @@ def init_config_cmd(
     force: Annotated[bool, typer.Option("--force", "-f", help="Overwrite existing config")] = False,
 ) -> None:
     """Initialize configuration file with defaults."""
+    console = _console()
     config_path = get_config_path()
 
     if config_path.exists() and not force:
@@ -58,26 +80,29 @@ def set_config(
     value: Annotated[str, typer.Argument(help="Value to set")],
 ) -> None:
     """Set a configuration value."""
+    console = _console()
     config = Config.load()
 
-    parts = key.split(".")
-    if len(parts) != 2:
+    section, sep, setting = key.partition(".")
+    if not sep or not section or not setting or "." in setting:
         console.print("[red]Key must be in format 'section.key'[/red]")
         raise typer.Exit(1)
 
-    section, setting = parts
-
-    # Get current config as dict
-    data = config.model_dump()
-
-    if section not in data:
-        data[section] = {}
+    if section not in Config.model_fields:
+        console.print(f"[red]Unknown config section: {section}[/red]")
+        raise typer.Exit(1)
 
-    data[section][setting] = value
+    section_obj = getattr(config, section)
+    if setting not in type(section_obj).model_fields:
+        console.print(f"[red]Unknown config key: {key}[/red]")
+        raise typer.Exit(1)
 
-    # Save updated config
+    # Re-validate only the section being changed, then swap it into the config
     try:
-        updated_config = Config(**data)
+        updated_section = type(section_obj).model_validate(
+            {**section_obj.model_dump(), setting: value}
+        )
+        updated_config = config.model_copy(update={section: updated_section})
         updated_config.save()
         console.print(f"[green]Set {key} = {value}[/green]")
     except Exception as e:
@@ -1,89 +1,234 @@
 """Item commands for Le Stash CLI."""
 
+import io
 import json
 import re
+import sqlite3
+from collections.abc import Callable, Iterable, Sequence
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any, TextIO
 
 import typer
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 
 from lestash.core.config import Config
-from lestash.core.database import get_connection, get_person_profile, get_post_cache
+from lestash.core.database import get_connection, get_post_cache
 from lestash.core.enrichment import (
+    ProfileCache,
     get_author_actor,
     get_item_subtype,
     get_preview,
+    lookup_profile,
+    prefetch_post_cache,
+    prefetch_profiles,
     resolve_author,
 )
 from lestash.models.item import Item
 
+# Content characters fetched for table rows; reaction/comment previews are
+# rebuilt from the first part of the content
+_LIST_CONTENT_CHARS = 200
+
+# Table column caps: previews are at most ~50 characters plus a reaction
+# prefix, names are display names or URNs
+_PREVIEW_WIDTH = 60
+_NAME_WIDTH = 30
+
+# Metadata keys read by the display helpers (subtype, author/actor and
+# reaction previews). json_patch drops the keys an item does not have, so
+# wide LinkedIn payloads are reduced in SQLite rather than decoded in Python.
+_LIST_METADATA = """
+    CASE WHEN items.metadata IS NULL THEN NULL ELSE json_patch('{}', json_object(
+        'resource_name', items.resource_name,
+        'reaction_type', items.reaction_type,
+        'reacted_to', items.reacted_to,
+        'commented_on', json_extract(items.metadata, '$.commented_on'),
+        'raw', json_object(
+            'owner', json_extract(items.metadata, '$.raw.owner'),
+            'actor', json_extract(items.metadata, '$.raw.actor')
+        )
+    )) END
+"""
+
+# Columns needed to render list/search rows. The standard preview and the
+# created date are formatted by SQLite; the date is cut from the stored text
+# so it keeps its stored wall time instead of being converted to UTC. Full
+# content and metadata are only read by show/export/draft.
+_LIST_COLUMNS = f"""
+    items.id, items.source_type, items.title,
+    substr(items.content, 1, {_LIST_CONTENT_CHARS}) AS content,
+    items.author, {_LIST_METADATA} AS metadata,
+    coalesce(
+        nullif(items.title, ''),
+        CASE WHEN length(items.content) > 50
+            THEN substr(items.content, 1, 50) || '...'
+            ELSE items.content
+        END
+    ) AS preview,
+    coalesce(
+        CASE WHEN length(items.created_at) >= 16
+            THEN replace(substr(items.created_at, 1, 16), 'T', ' ')
+            ELSE strftime('%Y-%m-%d %H:%M', items.created_at)
+        END,
+        '-'
+    ) AS created
+"""
+
+
+# Single-item lookup shared by show and draft. sqlite3 keeps a per-connection
+# cache of prepared statements keyed by SQL text, so one constant string is
+# compiled once per connection however often it runs.
+_SELECT_ITEM = "SELECT * FROM items WHERE id = ?"
+
+# Parent activity id inside a LinkedIn comment URN
+_ACTIVITY_ID_RE = re.compile(r"activity:(\d+)")
+
+
+# Any run of non-word characters or underscores. A run that contains a
+# separator (whitespace, "_" or "-") becomes one dash; punctuation-only runs
+# are dropped, so "don't stop" -> "dont-stop".
+_SLUG_RUN = re.compile(r"[\W_]+")
+
+
+def _slug_separator(match: re.Match[str]) -> str:
+    return "-" if any(c in "_-" or c.isspace() for c in match.group()) else ""
+
+
+# ASCII fast path for the same rules: separators map to "-" and every other
+# non-alphanumeric character is deleted, leaving only dash runs to collapse.
+_SLUG_TABLE = str.maketrans(
+    {c: "-" if c.isspace() or c in "_-" else "" for c in map(chr, range(128)) if not c.isalnum()}
+)
+
 
 def _slugify(text: str) -> str:
     """Convert text to a URL-friendly slug."""
     text = text.lower()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_]+", "-", text)
-    text = re.sub(r"-+", "-", text)
+    if text.isascii():
+        return "-".join(filter(None, text.translate(_SLUG_TABLE).split("-")))[:50]
+    text = _SLUG_RUN.sub(_slug_separator, text)
     return text.strip("-")[:50]
 
 
-def _format_microblog_draft(item: Item) -> str:
-    """Format an item as a Micro.blog draft markdown file.
+# Line breaks and tabs flattened to spaces in generated draft titles
+_TITLE_WHITESPACE = str.maketrans("\n\r\t", "   ")
+
+
+def _write_microblog_draft(item: Item, f: TextIO) -> None:
+    """Write an item as a Micro.blog draft markdown file.
 
     Args:
         item: The item to format
-
-    Returns:
-        Markdown string with YAML frontmatter
+        f: Text stream to write the markdown (with YAML frontmatter) to
     """
     # Generate title
     if item.title:
         title = f"Notes on: {item.title}"
     else:
-        preview = item.content[:50].replace("\n", " ")
-        title = f"Notes on: {preview}..."
-
-    # Build frontmatter
-    frontmatter = f"""---
-title: "{title}"
-status: "draft"
-type: "post"
-location: "drafts"
----"""
-
-    # Build content with source reference
-    lines = [frontmatter, ""]
-
-    # Add source metadata as HTML comment
-    lines.append(f"<!-- Source: {item.source_type} item #{item.id} -->")
-    if item.url:
-        lines.append(f"<!-- Original: {item.url} -->")
-    lines.append("")
+        preview = item.content[:50].translate(_TITLE_WHITESPACE)
+        ellipsis = "..." if len(item.content) > 50 else ""
+        title = f"Notes on: {preview}{ellipsis}"
 
-    # Add placeholder for user's notes
-    lines.append("[Your notes here]")
-    lines.append("")
+    # Frontmatter
+    f.write(f'---\ntitle: "{title}"\nstatus: "draft"\ntype: "post"\nlocation: "drafts"\n---\n\n')
 
-    # Add reference section
-    lines.append("---")
-    lines.append("")
+    # Source metadata as HTML comment
+    f.write(f"<!-- Source: {item.source_type} item #{item.id} -->\n")
+    if item.url:
+        f.write(f"<!-- Original: {item.url} -->\n")
+
+    # Placeholder for user's notes, then the reference section
+    f.write("\n[Your notes here]\n\n---\n\n")
 
     if item.title and item.url:
-        lines.append(f"*Reference: [{item.title}]({item.url})*")
+        f.write(f"*Reference: [{item.title}]({item.url})*")
     elif item.title:
-        lines.append(f"*Reference: {item.title}*")
+        f.write(f"*Reference: {item.title}*")
     elif item.url:
-        lines.append(f"*Reference: {item.url}*")
+        f.write(f"*Reference: {item.url}*")
     else:
-        lines.append(f"*Source: {item.source_type} (lestash item #{item.id})*")
+        f.write(f"*Source: {item.source_type} (lestash item #{item.id})*")
 
     # Add creation date if available
     if item.created_at:
-        lines.append(f"*Date: {item.created_at.strftime('%Y-%m-%d')}*")
+        f.write(f"\n*Date: {item.created_at.date().isoformat()}*")
+
+
+def _format_microblog_draft(item: Item) -> str:
+    """Format an item as a Micro.blog draft markdown string."""
+    buffer = io.StringIO()
+    _write_microblog_draft(item, buffer)
+    return buffer.getvalue()
+
+
+def _json_encoder(pretty: bool) -> Callable[[Any], str]:
+    """Return a reused stdlib encoder for one object; compact unless ``pretty``."""
+    if pretty:
+        return json.JSONEncoder(indent=2, default=str).encode
+    return json.JSONEncoder(separators=(",", ":"), default=str).encode
+
+
+def _write_json_array(f: TextIO, objects: Iterable[Any], pretty: bool = False) -> int:
+    """Write ``objects`` to ``f`` as a JSON array, one element at a time.
+
+    Only the element being encoded is held in memory, so exports stay flat
+    regardless of how many rows the cursor yields. Each element starts on
+    its own line; ``pretty`` also indents within elements.
 
-    return "\n".join(lines)
+    Returns:
+        Number of elements written
+    """
+    encode = _json_encoder(pretty)
+    count = 0
+    f.write("[")
+    for obj in objects:
+        f.write(",\n" if count else "\n")
+        f.write(encode(obj))
+        count += 1
+    f.write("\n]" if count else "]")
+    return count
+
+
+def _print_query_plan(conn: sqlite3.Connection, query: str, params: Sequence[Any]) -> None:
+    """Print SQLite's EXPLAIN QUERY PLAN for ``query`` (used by --debug)."""
+    for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params):
+        console.print(f"[dim]plan: {row['detail']}[/dim]", highlight=False)
+
+
+def _items_table() -> Table:
+    """Create the table used by list and search, one row per item."""
+    # Bounded widths keep rich's fit pass cheap on long listings
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("ID", style="dim", justify="right", no_wrap=True)
+    table.add_column("Type", no_wrap=True)
+    table.add_column("Title / Content Preview", max_width=_PREVIEW_WIDTH)
+    table.add_column("Author", max_width=_NAME_WIDTH)
+    table.add_column("Actor", max_width=_NAME_WIDTH)
+    table.add_column("Created", width=len("YYYY-MM-DD HH:MM"), no_wrap=True)
+    return table
+
+
+def _table_cells(conn: sqlite3.Connection, rows: list[sqlite3.Row]) -> list[tuple[str, ...]]:
+    """Format list/search rows (selected with _LIST_COLUMNS) as table cells.
+
+    Profiles and cached reaction targets for the whole page are loaded up
+    front, so each row only formats strings.
+    """
+    items = [Item.preview_from_row(row) for row in rows]
+    profile_cache = prefetch_profiles(conn, items)
+    post_cache = prefetch_post_cache(conn, items)
+    return [
+        (
+            str(item.id),
+            get_item_subtype(item),
+            get_preview(conn, item, fallback=row["preview"], post_cache=post_cache),
+            *get_author_actor(conn, item, profile_cache, post_cache),
+            row["created"],
+        )
+        for row, item in zip(rows, items, strict=True)
+    ]
 
 
 app = typer.Typer(help="Manage items in your knowledge base.")
@@ -97,12 +242,13 @@ def list_items(
     ] = None,
     own: Annotated[bool | None, typer.Option("--own", help="Show only your own content")] = None,
     limit: Annotated[int, typer.Option("--limit", "-n", help="Limit results")] = 20,
+    debug: Annotated[bool, typer.Option("--debug", help="Print the SQLite query plan")] = False,
 ) -> None:
     """List items in the knowledge base."""
     config = Config.load()
 
     with get_connection(config) as conn:
-        query = "SELECT * FROM items WHERE 1=1"
+        query = f"SELECT {_LIST_COLUMNS} FROM items WHERE 1=1"
         params: list = []
 
         if source:
@@ -116,6 +262,8 @@ def list_items(
         query += " ORDER BY datetime(created_at) DESC LIMIT ?"
         params.append(limit)
 
+        if debug:
+            _print_query_plan(conn, query, params)
         cursor = conn.execute(query, params)
         rows = cursor.fetchall()
 
@@ -123,29 +271,9 @@ def list_items(
             console.print("[dim]No items found.[/dim]")
             return
 
-        table = Table(show_header=True, header_style="bold")
-        table.add_column("ID", style="dim")
-        table.add_column("Type")
-        table.add_column("Title / Content Preview")
-        table.add_column("Author")
-        table.add_column("Actor")
-        table.add_column("Created")
-
-        for row in rows:
-            item = Item.from_row(row)
-            preview = get_preview(conn, item)
-            author, actor = get_author_actor(conn, item)
-            created = item.created_at.strftime("%Y-%m-%d %H:%M") if item.created_at else "-"
-            subtype = get_item_subtype(item)
-            table.add_row(
-                str(item.id),
-                subtype,
-                preview,
-                author,
-                actor,
-                created,
-            )
-
+        table = _items_table()
+        for cells in _table_cells(conn, rows):
+            table.add_row(*cells)
         console.print(table)
 
 
@@ -153,50 +281,37 @@ def list_items(
 def search_items(
     query: Annotated[str, typer.Argument(help="Search query")],
     limit: Annotated[int, typer.Option("--limit", "-n", help="Limit results")] = 20,
+    debug: Annotated[bool, typer.Option("--debug", help="Print the SQLite query plan")] = False,
 ) -> None:
     """Search items using full-text search."""
     config = Config.load()
 
     with get_connection(config) as conn:
-        cursor = conn.execute(
-            """
-            SELECT items.* FROM items
-            JOIN items_fts ON items.id = items_fts.rowid
-            WHERE items_fts MATCH ?
-            ORDER BY rank
-            LIMIT ?
-            """,
-            (query, limit),
-        )
+        # Let FTS5 cut the top-K hits on its own table before any wide
+        # items rows are read.
+        sql = f"""
+            WITH hits AS (
+                SELECT rowid, rank FROM items_fts
+                WHERE items_fts MATCH ?
+                ORDER BY rank
+                LIMIT ?
+            )
+            SELECT {_LIST_COLUMNS} FROM hits
+            JOIN items ON items.id = hits.rowid
+            ORDER BY hits.rank
+        """
+        if debug:
+            _print_query_plan(conn, sql, (query, limit))
+        cursor = conn.execute(sql, (query, limit))
         rows = cursor.fetchall()
 
         if not rows:
             console.print(f"[dim]No items found matching '{query}'.[/dim]")
             return
 
-        table = Table(show_header=True, header_style="bold")
-        table.add_column("ID", style="dim")
-        table.add_column("Type")
-        table.add_column("Title / Content Preview")
-        table.add_column("Author")
-        table.add_column("Actor")
-        table.add_column("Created")
-
-        for row in rows:
-            item = Item.from_row(row)
-            preview = get_preview(conn, item)
-            author, actor = get_author_actor(conn, item)
-            created = item.created_at.strftime("%Y-%m-%d %H:%M") if item.created_at else "-"
-            subtype = get_item_subtype(item)
-            table.add_row(
-                str(item.id),
-                subtype,
-                preview,
-                author,
-                actor,
-                created,
-            )
-
+        table = _items_table()
+        for cells in _table_cells(conn, rows):
+            table.add_row(*cells)
         console.print(table)
 
 
@@ -208,7 +323,7 @@ def show_item(
     config = Config.load()
 
     with get_connection(config) as conn:
-        cursor = conn.execute("SELECT * FROM items WHERE id = ?", (item_id,))
+        cursor = conn.execute(_SELECT_ITEM, (item_id,))
         row = cursor.fetchone()
 
         if not row:
@@ -217,33 +332,38 @@ def show_item(
 
         item = Item.from_row(row)
 
+        # Collect the output and render it in one print
+        lines: list[str | Text] = []
+
         # Resolve author profile
-        author_display = resolve_author(conn, item.author)
-        author_profile = get_person_profile(conn, item.author) if item.author else None
+        profile_cache: ProfileCache = {}
+        author_display = resolve_author(conn, item.author, profile_cache)
+        author_profile = lookup_profile(conn, item.author, profile_cache) if item.author else None
 
-        console.print(f"[bold]ID:[/bold] {item.id}")
-        console.print(f"[bold]Source:[/bold] {item.source_type}")
+        lines.append(f"[bold]ID:[/bold] {item.id}")
+        lines.append(f"[bold]Source:[/bold] {item.source_type}")
         if item.source_id:
-            console.print(f"[bold]Source ID:[/bold] {item.source_id}")
+            lines.append(f"[bold]Source ID:[/bold] {item.source_id}")
         if item.url:
-            console.print(f"[bold]URL:[/bold] {item.url}")
+            lines.append(f"[bold]URL:[/bold] {item.url}")
         if item.title:
-            console.print(f"[bold]Title:[/bold] {item.title}")
-        console.print(f"[bold]Author:[/bold] {author_display}")
+            lines.append(f"[bold]Title:[/bold] {item.title}")
+        lines.append(f"[bold]Author:[/bold] {author_display}")
         if author_profile and author_profile.get("profile_url"):
-            console.print(f"[bold]Author Profile:[/bold] {author_profile['profile_url']}")
+            lines.append(f"[bold]Author Profile:[/bold] {author_profile['profile_url']}")
 
         # Show what this item is responding to (reaction or comment target)
         if item.metadata:
-            target_urn = item.metadata.get("reacted_to") or item.metadata.get("commented_on")
+            reacted_to = item.metadata.get("reacted_to")
+            target_urn = reacted_to or item.metadata.get("commented_on")
             if target_urn:
                 # Detect if target is a comment or post
                 is_comment_target = target_urn.startswith("urn:li:comment:")
-                if "reacted_to" in item.metadata:
+                if reacted_to is not None:
                     target_label = "Reacted To Comment" if is_comment_target else "Reacted To"
                 else:
                     target_label = "Commented On"
-                console.print(f"[bold]{target_label}:[/bold] {target_urn}")
+                lines.append(f"[bold]{target_label}:[/bold] {target_urn}")
 
                 # Generate URL
                 target_url = None
@@ -251,46 +371,50 @@ def show_item(
                     target_url = f"https://www.linkedin.com/feed/update/{target_urn}"
                 elif is_comment_target:
                     # Extract parent activity from comment URN
-                    match = re.search(r"activity:(\d+)", target_urn)
+                    match = _ACTIVITY_ID_RE.search(target_urn)
                     if match:
                         parent_activity = match.group(1)
                         target_url = f"https://www.linkedin.com/feed/update/urn:li:activity:{parent_activity}"
                 if target_url:
-                    console.print(f"[bold]{target_label} URL:[/bold] {target_url}")
+                    lines.append(f"[bold]{target_label} URL:[/bold] {target_url}")
 
                 # Show cached content if available
                 cached = get_post_cache(conn, target_urn)
                 if cached:
                     content_label = "Comment Content" if is_comment_target else "Post Content"
                     if cached.get("content_preview"):
-                        console.print()
-                        console.print(f"[bold]{content_label}:[/bold]")
+                        lines.append("")
+                        lines.append(f"[bold]{content_label}:[/bold]")
                         preview = cached["content_preview"]
                         if len(preview) > 300:
-                            console.print(f"[dim]{preview[:300]}...[/dim]")
+                            lines.append(f"[dim]{preview[:300]}...[/dim]")
                         else:
-                            console.print(f"[dim]{preview}[/dim]")
+                            lines.append(f"[dim]{preview}[/dim]")
                         if cached.get("author_name"):
-                            console.print(f"[dim]— {cached['author_name']}[/dim]")
+                            lines.append(f"[dim]— {cached['author_name']}[/dim]")
                     if cached.get("reactor_name"):
-                        console.print(
+                        lines.append(
                             f"[bold]Reacted By:[/bold] {cached['reactor_name']} (your content)"
                         )
                     if cached.get("image_path"):
-                        console.print(f"[bold]Screenshot:[/bold] {cached['image_path']}")
+                        lines.append(f"[bold]Screenshot:[/bold] {cached['image_path']}")
 
         if item.created_at:
-            console.print(f"[bold]Created:[/bold] {item.created_at}")
-        console.print(f"[bold]Fetched:[/bold] {item.fetched_at}")
-        console.print(f"[bold]Own Content:[/bold] {item.is_own_content}")
-        console.print()
-        console.print("[bold]Content:[/bold]")
-        console.print(item.content)
+            lines.append(f"[bold]Created:[/bold] {item.created_at}")
+        lines.append(f"[bold]Fetched:[/bold] {item.fetched_at}")
+        lines.append(f"[bold]Own Content:[/bold] {item.is_own_content}")
+        lines.append("")
+        lines.append("[bold]Content:[/bold]")
+        lines.append(item.content)
 
         if item.metadata:
-            console.print()
-            console.print("[bold]Metadata:[/bold]")
-            console.print(json.dumps(item.metadata, indent=2))
+            lines.append("")
+            lines.append("[bold]Metadata:[/bold]")
+            # Plain Text: rich markup parsing and highlighting over large
+            # payloads is slow, and "[...]" in metadata is not markup
+            lines.append(Text(json.dumps(item.metadata, indent=2)))
+
+    console.print(*lines, sep="\n")
 
 
 @app.command("export")
@@ -301,6 +425,11 @@ def export_items(
     source: Annotated[
         str | None, typer.Option("--source", "-s", help="Filter by source type")
     ] = None,
+    limit: Annotated[
+        int | None, typer.Option("--limit", "-n", help="Export at most N newest items")
+    ] = None,
+    pretty: Annotated[bool, typer.Option("--pretty", help="Indent the JSON for reading")] = False,
+    debug: Annotated[bool, typer.Option("--debug", help="Print the SQLite query plan")] = False,
 ) -> None:
     """Export items to JSON."""
     config = Config.load()
@@ -313,17 +442,21 @@ def export_items(
             query += " WHERE source_type = ?"
             params.append(source)
 
-        query += " ORDER BY created_at DESC"
+        query += " ORDER BY datetime(created_at) DESC"
 
-        cursor = conn.execute(query, params)
-        rows = cursor.fetchall()
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
 
-    items = [Item.from_row(row).model_dump(mode="json") for row in rows]
-
-    with open(output, "w") as f:
-        json.dump(items, f, indent=2, default=str)
+        if debug:
+            _print_query_plan(conn, query, params)
+        cursor = conn.execute(query, params)
+        with open(output, "w", encoding="utf-8") as f:
+            count = _write_json_array(
+                f, (Item.from_row(row).model_dump(mode="json") for row in cursor), pretty
+            )
 
-    console.print(f"[green]Exported {len(items)} items to {output}[/green]")
+    console.print(f"[green]Exported {count} items to {output}[/green]")
 
 
 @app.command("draft")
@@ -349,7 +482,7 @@ def create_draft(
     config = Config.load()
 
     with get_connection(config) as conn:
-        cursor = conn.execute("SELECT * FROM items WHERE id = ?", (item_id,))
+        cursor = conn.execute(_SELECT_ITEM, (item_id,))
         row = cursor.fetchone()
 
         if not row:
@@ -358,9 +491,6 @@ def create_draft(
 
         item = Item.from_row(row)
 
-    # Generate markdown content
-    content = _format_microblog_draft(item)
-
     # Determine output path
     if filename:
         name = filename if filename.endswith(".md") else f"{filename}.md"
@@ -377,7 +507,8 @@ def create_draft(
         output_path = Path(name)
 
     # Write the file
-    output_path.write_text(content)
+    with output_path.open("w", encoding="utf-8") as f:
+        _write_microblog_draft(item, f)
 
     console.print(f"[green]Created draft: {output_path}[/green]")
     console.print(f"[dim]Source: {item.source_type} item #{item.id}[/dim]")
@@ -1,6 +1,9 @@
 """Main CLI for Le Stash."""
 
+from typing import TYPE_CHECKING
+
 import typer
+from typer.core import TyperGroup
 
 from lestash import __version__
 from lestash.cli import (
@@ -16,15 +19,57 @@ from lestash.cli import (
 )
 from lestash.core.database import init_database
 from lestash.core.logging import get_console, get_logger, setup_logging
-from lestash.plugins.loader import load_plugins
+from lestash.plugins.loader import load_plugins, plugin_names
+
+if TYPE_CHECKING:
+    # The click types TyperGroup is declared with. Typer releases that import
+    # the click package have no typer._click, and mypy then treats these as Any.
+    from typer._click import Command, Context
+
+logger = get_logger("cli.main")
+
+
+def _plugin_command(name: str) -> "Command | None":
+    """Import the plugin ``name`` and build its command group."""
+    plugin = load_plugins([name]).get(name)
+    if plugin is None:
+        return None
+    try:
+        group = typer.main.get_group(plugin.get_commands())
+    except Exception as e:
+        logger.warning(f"Failed to register commands for '{name}': {e}")
+        return None
+    group.name = name
+    return group
+
+
+class PluginGroup(TyperGroup):
+    """Root command group that imports a plugin only when its commands are looked up.
+
+    Installed plugins are listed by entry point name, so ``lestash items ...``
+    never imports one, while ``lestash --help`` still shows them all.
+    """
+
+    def list_commands(self, ctx: "Context") -> list[str]:
+        commands = super().list_commands(ctx)
+        return commands + [name for name in plugin_names() if name not in commands]
+
+    def get_command(self, ctx: "Context", cmd_name: str) -> "Command | None":
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in plugin_names():
+            command = _plugin_command(cmd_name)
+            if command is not None:
+                self.add_command(command, cmd_name)
+        return command
+
 
 app = typer.Typer(
     name="lestash",
     help="Le Stash - Personal knowledge base CLI.",
     no_args_is_help=True,
+    cls=PluginGroup,
 )
 console = get_console()
-logger = get_logger("cli.main")
 
 # Register core command groups
 app.add_typer(items.app, name="items")
@@ -38,17 +83,6 @@ app.add_typer(db.app, name="db")
 app.add_typer(enrich.app, name="enrich")
 
 
-def register_plugin_commands() -> None:
-    """Discover and register plugin commands."""
-    plugins = load_plugins()
-    for name, plugin in plugins.items():
-        try:
-            plugin_app = plugin.get_commands()
-            app.add_typer(plugin_app, name=name)
-        except Exception as e:
-            logger.warning(f"Failed to register commands for '{name}': {e}")
-
-
 @app.callback()
 def main(
     version: bool = typer.Option(False, "--version", "-v", help="Show version and exit."),
@@ -65,8 +99,5 @@ def main(
     init_database()
 
 
-# Register plugin commands at import time
-register_plugin_commands()
-
 if __name__ == "__main__":
     app()
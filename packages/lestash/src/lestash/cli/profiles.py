@@ -10,6 +10,7 @@ from lestash.core.database import (
     get_connection,
     list_person_profiles,
     upsert_person_profile,
+    write_batch,
 )
 from lestash.core.logging import get_console
 
@@ -56,7 +57,7 @@ def add_profile(
         console.print("[red]Error: Must provide at least --url or --name[/red]")
         raise typer.Exit(1)
 
-    with get_connection() as conn:
+    with get_connection() as conn, write_batch(conn):
         upsert_person_profile(conn, urn, profile_url=url, display_name=name)
 
     console.print(f"[green]Profile added/updated for {urn}[/green]")
@@ -67,7 +68,7 @@ def remove_profile(
     urn: Annotated[str, typer.Argument(help="Person URN to remove")],
 ) -> None:
     """Remove a person profile mapping."""
-    with get_connection() as conn:
+    with get_connection() as conn, write_batch(conn):
         deleted = delete_person_profile(conn, urn)
 
     if deleted:
@@ -1,24 +1,47 @@
 """Source commands for Le Stash CLI."""
 
-import json
+import functools
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from lestash.core.config import Config
-from lestash.core.database import get_connection
+from lestash.core.database import (
+    SYNC_BATCH_SIZE,
+    get_connection,
+    get_readonly_connection,
+    upsert_items_stream,
+)
+from lestash.models.item import ItemCreate
+from lestash.plugins.base import SourcePlugin
 from lestash.plugins.loader import load_plugins
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 app = typer.Typer(help="Manage content sources.")
-console = Console()
+
+
+@functools.cache
+def _console() -> "Console":
+    """Create the Rich console on first use so importing this module stays cheap."""
+    from rich.console import Console
+
+    return Console()
 
 
 @app.command("list")
 def list_sources() -> None:
     """List installed source plugins."""
+    from rich.table import Table
+
+    console = _console()
     plugins = load_plugins()
 
     if not plugins:
@@ -31,7 +54,7 @@ def list_sources() -> None:
     table.add_column("Status")
 
     config = Config.load()
-    with get_connection(config) as conn:
+    with get_readonly_connection(config) as conn:
         for name, plugin in plugins.items():
             cursor = conn.execute(
                 "SELECT enabled, last_sync FROM sources WHERE source_type = ?",
@@ -78,6 +101,7 @@ def disable_source(
     source_name: Annotated[str, typer.Argument(help="Source to stop syncing")],
 ) -> None:
     """Stop a source from being synced by `sync --all` (existing data is kept)."""
+    console = _console()
     _set_source_enabled(source_name, False)
     console.print(f"[yellow]Disabled {source_name}[/yellow] — `sync --all` will skip it.")
 
@@ -87,123 +111,121 @@ def enable_source(
     source_name: Annotated[str, typer.Argument(help="Source to resume syncing")],
 ) -> None:
     """Re-enable a previously disabled source."""
+    console = _console()
     _set_source_enabled(source_name, True)
     console.print(f"[green]Enabled {source_name}[/green]")
 
 
-@app.command("sync")
-def sync_source(
-    source_name: Annotated[str | None, typer.Argument(help="Source to sync (omit for all)")] = None,
-    all_sources: Annotated[bool, typer.Option("--all", help="Sync all enabled sources")] = False,
-) -> None:
-    """Sync items from a source."""
-    plugins = load_plugins()
+# Upper bound on sources synced concurrently by `sync --all`
+SYNC_WORKERS = 8
 
-    if not plugins:
-        console.print("[red]No source plugins installed.[/red]")
-        raise typer.Exit(1)
+# Serializes database writes across concurrent source syncs, so one
+# source's long transaction makes the others wait rather than hit the
+# SQLite busy timeout. Plugin fetches happen outside it.
+_WRITE_LOCK = threading.Lock()
 
-    config = Config.load()
+_START_SYNC_LOG = "INSERT INTO sync_log (source_type, started_at, status) VALUES (?, ?, ?)"
 
-    if source_name:
-        # An explicit source name syncs even if disabled.
-        sources_to_sync = [source_name]
-    elif all_sources:
-        # --all syncs every registered plugin except those explicitly disabled.
-        with get_connection(config) as conn:
-            disabled = _disabled_sources(conn)
-        sources_to_sync = [name for name in plugins if name not in disabled]
-        for name in sorted(disabled & set(plugins)):
-            console.print(f"[dim]Skipping {name} (disabled)[/dim]")
-    else:
-        console.print("[red]Specify a source name or use --all[/red]")
-        raise typer.Exit(1)
+_SET_LAST_SYNC = """
+    INSERT INTO sources (source_type, last_sync)
+    VALUES (?, ?)
+    ON CONFLICT(source_type) DO UPDATE SET last_sync = excluded.last_sync
+"""
 
-    for name in sources_to_sync:
-        if name not in plugins:
-            console.print(f"[red]Unknown source: {name}[/red]")
-            continue
+_FINISH_SYNC_LOG = """
+    UPDATE sync_log SET
+        completed_at = ?,
+        status = ?,
+        items_added = ?,
+        items_updated = ?,
+        error_message = ?
+    WHERE id = ?
+"""
 
-        plugin = plugins[name]
-        plugin_config = config.get_plugin_config(name)
 
-        console.print(f"[bold]Syncing {name}...[/bold]")
+def _store_items(
+    conn: sqlite3.Connection,
+    items: Iterable[ItemCreate],
+    batch_size: int = SYNC_BATCH_SIZE,
+) -> tuple[int, int]:
+    """Upsert items streamed from a plugin under ``_WRITE_LOCK``; see ``upsert_items_stream``."""
+    return upsert_items_stream(conn, items, batch_size, lock=_WRITE_LOCK)
 
-        with get_connection(config) as conn:
-            # Log sync start
-            started_at = datetime.now()
-            cursor = conn.execute(
-                "INSERT INTO sync_log (source_type, started_at, status) VALUES (?, ?, ?)",
-                (name, started_at, "running"),
-            )
-            sync_id = cursor.lastrowid
-            conn.commit()
 
-            items_added = 0
-            items_updated = 0
-            error_message = None
+# Items a plugin may fetch ahead of the database writer
+PREFETCH_ITEMS = 2000
+
+_DONE = object()
+
+
+def _prefetch(items: Iterable[ItemCreate], maxsize: int = PREFETCH_ITEMS) -> Iterator[ItemCreate]:
+    """Iterate ``items`` on a background thread, ``maxsize`` items ahead.
+
+    Lets a plugin's network fetches overlap with the batch writes that
+    consume them. An exception raised by the plugin is re-raised here, after
+    the items yielded before it.
+    """
+    buffer: queue.Queue[object] = queue.Queue(maxsize=maxsize)
+    stopped = threading.Event()
 
+    def put(value: object) -> bool:
+        while not stopped.is_set():
             try:
-                for item in plugin.sync(plugin_config):
-                    # Try to insert, update on conflict
-                    metadata_json = json.dumps(item.metadata) if item.metadata else None
-                    cursor = conn.execute(
-                        """
-                        INSERT INTO items (
-                            source_type, source_id, url, title, content,
-                            author, created_at, is_own_content, metadata, parent_id
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ON CONFLICT(source_type, source_id) DO UPDATE SET
-                            url = excluded.url,
-                            title = excluded.title,
-                            content = excluded.content,
-                            author = excluded.author,
-                            is_own_content = excluded.is_own_content,
-                            metadata = excluded.metadata,
-                            parent_id = excluded.parent_id
-                        """,
-                        (
-                            item.source_type,
-                            item.source_id,
-                            item.url,
-                            item.title,
-                            item.content,
-                            item.author,
-                            item.created_at,
-                            item.is_own_content,
-                            metadata_json,
-                            item.parent_id,
-                        ),
-                    )
-                    if cursor.rowcount > 0:
-                        items_added += 1
-
-                    # Insert media attachments if present
-                    if item.media:
-                        from lestash.core.database import add_item_media
-
-                        row = conn.execute(
-                            "SELECT id FROM items WHERE source_type = ? AND source_id = ?",
-                            (item.source_type, item.source_id),
-                        ).fetchone()
-                        item_id = row[0] if row else None
-                        if item_id:
-                            for media in item.media:
-                                add_item_media(
-                                    conn,
-                                    item_id,
-                                    media_type=media.media_type,
-                                    url=media.url,
-                                    local_path=media.local_path,
-                                    mime_type=media.mime_type,
-                                    alt_text=media.alt_text,
-                                    position=media.position,
-                                    source_origin=media.source_origin,
-                                    _commit=False,
-                                )
+                buffer.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as e:
+            put(e)
+        else:
+            put(_DONE)
+
+    producer = threading.Thread(target=produce, name="lestash-sync-fetch", daemon=True)
+    producer.start()
+    try:
+        while (value := buffer.get()) is not _DONE:
+            if isinstance(value, BaseException):
+                raise value
+            yield value  # type: ignore[misc]
+    finally:
+        # Unblocks the producer if the consumer stops early
+        stopped.set()
+
+
+def _sync_one(name: str, plugin: SourcePlugin, config: Config) -> str:
+    """Sync one source into the database and return its final sync status.
+
+    Safe to run for several sources at once: each call uses its own
+    connection and takes ``_WRITE_LOCK`` around every write.
+    """
+    console = _console()
+    plugin_config = config.get_plugin_config(name)
+
+    console.print(f"[bold]Syncing {name}...[/bold]")
 
-                conn.commit()
+    with get_connection(config) as conn:
+        # Log sync start
+        started_at = datetime.now()
+        with _WRITE_LOCK:
+            cursor = conn.execute(_START_SYNC_LOG, (name, started_at, "running"))
+            sync_id = cursor.lastrowid
+            conn.commit()
 
+        items_added = 0
+        items_updated = 0
+        error_message = None
+
+        try:
+            items_added, items_updated = _store_items(conn, _prefetch(plugin.sync(plugin_config)))
+
+            with _WRITE_LOCK:
                 # Resolve parent_id for LinkedIn reactions/comments
                 if name == "linkedin":
                     try:
@@ -253,91 +275,125 @@ def sync_source(
                     except ImportError:
                         pass
 
-                # Update source last_sync
-                conn.execute(
-                    """
-                    INSERT INTO sources (source_type, last_sync)
-                    VALUES (?, ?)
-                    ON CONFLICT(source_type) DO UPDATE SET last_sync = excluded.last_sync
-                    """,
-                    (name, datetime.now()),
-                )
-                conn.commit()
-
-                status = "completed"
-            except Exception as e:
-                status = "failed"
-                error_message = str(e)
-                console.print(f"[red]Error syncing {name}: {e}[/red]")
-
-            # Update sync log
+            status = "completed"
+        except Exception as e:
+            status = "failed"
+            error_message = str(e)
+            console.print(f"[red]Error syncing {name}: {e}[/red]")
+
+        # Record last_sync and close out the sync log in one commit
+        completed_at = datetime.now()
+        with _WRITE_LOCK:
+            if status == "completed":
+                conn.execute(_SET_LAST_SYNC, (name, completed_at))
             conn.execute(
-                """
-                UPDATE sync_log SET
-                    completed_at = ?,
-                    status = ?,
-                    items_added = ?,
-                    items_updated = ?,
-                    error_message = ?
-                WHERE id = ?
-                """,
-                (datetime.now(), status, items_added, items_updated, error_message, sync_id),
+                _FINISH_SYNC_LOG,
+                (completed_at, status, items_added, items_updated, error_message, sync_id),
             )
             conn.commit()
 
-        if status == "completed":
-            console.print(f"[green]Synced {name}: {items_added} items added[/green]")
+    if status == "completed":
+        console.print(
+            f"[green]Synced {name}: {items_added} items added, {items_updated} updated[/green]"
+        )
+
+    return status
+
+
+@app.command("sync")
+def sync_source(
+    source_name: Annotated[str | None, typer.Argument(help="Source to sync (omit for all)")] = None,
+    all_sources: Annotated[bool, typer.Option("--all", help="Sync all enabled sources")] = False,
+) -> None:
+    """Sync items from a source."""
+    console = _console()
+    plugins = load_plugins()
+
+    if not plugins:
+        console.print("[red]No source plugins installed.[/red]")
+        raise typer.Exit(1)
+
+    config = Config.load()
+
+    if source_name:
+        # An explicit source name syncs even if disabled.
+        sources_to_sync = [source_name]
+    elif all_sources:
+        # --all syncs every registered plugin except those explicitly disabled.
+        with get_connection(config) as conn:
+            disabled = _disabled_sources(conn)
+        sources_to_sync = [name for name in plugins if name not in disabled]
+        for name in sorted(disabled & set(plugins)):
+            console.print(f"[dim]Skipping {name} (disabled)[/dim]")
+    else:
+        console.print("[red]Specify a source name or use --all[/red]")
+        raise typer.Exit(1)
+
+    unknown = [name for name in sources_to_sync if name not in plugins]
+    for name in unknown:
+        console.print(f"[red]Unknown source: {name}[/red]")
+    sources_to_sync = [name for name in sources_to_sync if name in plugins]
+
+    if len(sources_to_sync) <= 1:
+        for name in sources_to_sync:
+            _sync_one(name, plugins[name], config)
+        return
+
+    # Plugin fetches are network-bound, so independent sources run side by
+    # side; _WRITE_LOCK keeps their database writes one at a time.
+    with ThreadPoolExecutor(max_workers=min(SYNC_WORKERS, len(sources_to_sync))) as pool:
+        futures = [pool.submit(_sync_one, name, plugins[name], config) for name in sources_to_sync]
+        for future in as_completed(futures):
+            future.result()
+
+
+# Sync log statuses with their table markup; other values render unstyled
+_STATUS_MARKUP = {
+    "completed": "[green]completed[/green]",
+    "failed": "[red]failed[/red]",
+    "running": "[yellow]running[/yellow]",
+}
 
 
 @app.command("status")
 def source_status() -> None:
     """Show sync status for all sources."""
+    from rich.table import Table
+
+    console = _console()
     config = Config.load()
 
-    with get_connection(config) as conn:
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Source")
+    table.add_column("Started")
+    table.add_column("Status")
+    table.add_column("Items")
+    table.add_column("Error")
+
+    with get_readonly_connection(config) as conn:
         cursor = conn.execute(
             """
-            SELECT source_type, started_at, completed_at, status,
-                   items_added, items_updated, error_message
+            SELECT source_type, started_at, status, items_added, error_message
             FROM sync_log
             ORDER BY started_at DESC
             LIMIT 20
             """
         )
-        rows = cursor.fetchall()
+        # Rows go straight from the cursor into the table, as plain tuples
+        cursor.row_factory = None
+        for source_type, started_at, status, items_added, error_message in cursor:
+            started = started_at[:16] if started_at else "-"
+            items = f"+{items_added}" if items_added else "-"
+            error = (
+                error_message[:30] + "..."
+                if error_message and len(error_message) > 30
+                else (error_message or "-")
+            )
+
+            table.add_row(source_type, started, _STATUS_MARKUP.get(status, status), items, error)
 
-    if not rows:
+    if not table.row_count:
         console.print("[dim]No sync history.[/dim]")
         return
 
-    table = Table(show_header=True, header_style="bold")
-    table.add_column("Source")
-    table.add_column("Started")
-    table.add_column("Status")
-    table.add_column("Items")
-    table.add_column("Error")
-
-    for row in rows:
-        started = row["started_at"][:16] if row["started_at"] else "-"
-        items = f"+{row['items_added']}" if row["items_added"] else "-"
-        error = (
-            row["error_message"][:30] + "..."
-            if row["error_message"] and len(row["error_message"]) > 30
-            else (row["error_message"] or "-")
-        )
-
-        status_style = {
-            "completed": "green",
-            "failed": "red",
-            "running": "yellow",
-        }.get(row["status"], "")
-
-        table.add_row(
-            row["source_type"],
-            started,
-            f"[{status_style}]{row['status']}[/{status_style}]" if status_style else row["status"],
-            items,
-            error,
-        )
-
     console.print(table)
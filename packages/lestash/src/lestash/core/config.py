@@ -1,10 +1,12 @@
 """Configuration management for Le Stash."""
 
+import functools
+import tomllib
 from pathlib import Path
 from typing import Any, Literal
 
-import toml
-from pydantic import BaseModel
+import tomli_w
+from pydantic import BaseModel, PrivateAttr
 
 
 def get_config_dir() -> Path:
@@ -73,32 +75,63 @@ class LoggingConfig(BaseModel):
             self.file_path = str(get_log_path())
 
 
+class SQLiteConfig(BaseModel):
+    """SQLite connection tuning, applied to every connection from get_connection."""
+
+    journal_mode: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY"] = "WAL"
+    synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    busy_timeout_ms: int = 5000
+    cache_size_kb: int = 20000  # Page cache per connection
+    temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    mmap_size_mb: int = 256  # Memory-mapped reads; 0 disables
+
+
 class Config(BaseModel):
     """Application configuration."""
 
     general: GeneralConfig = GeneralConfig()
     logging: LoggingConfig = LoggingConfig()
+    sqlite: SQLiteConfig = SQLiteConfig()
+
+    # Parsed TOML as loaded, including the plugin sections that have no model
+    _raw: dict[str, Any] = PrivateAttr(default_factory=dict)
 
     @classmethod
     def load(cls) -> "Config":
-        """Load configuration from file."""
+        """Load configuration from file.
+
+        The parsed config is reused until the file changes (or ``save()`` is
+        called), so commands that each call ``load()`` only parse it once.
+        Treat the result as read-only; use ``model_copy`` to change it.
+        """
         config_path = get_config_path()
-        if config_path.exists():
-            data = toml.load(config_path)
-            return cls(**data)
-        return cls()
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            return cls()
+        return _load_file(cls, config_path, stat.st_mtime_ns, stat.st_size)
 
     def save(self) -> None:
         """Save configuration to file."""
         config_path = get_config_path()
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, "w") as f:
-            toml.dump(self.model_dump(), f)
+        with open(config_path, "wb") as f:
+            tomli_w.dump({**self._raw, **self.model_dump()}, f)
+        _load_file.cache_clear()
 
     def get_plugin_config(self, plugin_name: str) -> dict[str, Any]:
         """Get configuration for a specific plugin."""
-        data = self.model_dump()
-        return data.get(plugin_name, {})
+        return dict(self._raw.get(plugin_name, {}))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_file(cls: type[Config], path: Path, mtime_ns: int, size: int) -> Config:
+    """Parse a config file; keyed on its mtime and size so edits are picked up."""
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+    config = cls(**data)
+    config._raw = data
+    return config
 
 
 def init_config() -> Config:
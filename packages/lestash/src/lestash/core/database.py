@@ -6,14 +6,15 @@ Each migration is applied once, incrementing the version number.
 
 from __future__ import annotations
 
+import json
 import logging
 import sqlite3
-from collections.abc import Iterable, Iterator
-from contextlib import contextmanager
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import AbstractContextManager, closing, contextmanager, nullcontext
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from lestash.core.config import Config
+from lestash.core.config import Config, SQLiteConfig
 
 if TYPE_CHECKING:
     from lestash.models.item import ItemCreate
@@ -21,7 +22,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 # Current schema version - increment when adding migrations
-SCHEMA_VERSION = 11
+SCHEMA_VERSION = 14
 
 # Base schema (version 0) - applied to new databases
 SCHEMA = """
@@ -379,8 +380,42 @@ MIGRATIONS = [
         CREATE INDEX IF NOT EXISTS idx_syndications_item ON syndications(item_id);
         """,
     ),
+    (
+        12,
+        "Add created-date indexes for newest-first item listings",
+        # Listings sort by datetime(created_at) so mixed timestamp formats
+        # order correctly; these expression indexes let SQLite walk the
+        # (optionally filtered) rows in that order instead of sorting them.
+        """
+        CREATE INDEX IF NOT EXISTS idx_items_created_dt ON items(datetime(created_at));
+        CREATE INDEX IF NOT EXISTS idx_items_source_created
+            ON items(source_type, datetime(created_at));
+        CREATE INDEX IF NOT EXISTS idx_items_own_created
+            ON items(is_own_content, datetime(created_at));
+        """,
+    ),
+    (
+        13,
+        "Add generated metadata columns for item subtypes",
+        # Note: the generated columns are added in apply_migrations() because
+        # SQLite has no IF NOT EXISTS for ALTER TABLE; see ITEM_METADATA_COLUMNS.
+        "",
+    ),
+    (
+        14,
+        "Add source + own-content created-date index for filtered listings",
+        """
+        CREATE INDEX IF NOT EXISTS idx_items_src_own_created
+            ON items(source_type, is_own_content, datetime(created_at));
+        """,
+    ),
 ]
 
+# Virtual columns on items extracted from the metadata JSON (migration 13).
+# They are computed on read, so SQL can select or filter on them without
+# decoding metadata in Python; malformed JSON yields NULL.
+ITEM_METADATA_COLUMNS = ("resource_name", "reaction_type", "reacted_to")
+
 
 def get_db_path(config: Config | None = None) -> Path:
     """Get the database path from config."""
@@ -402,7 +437,8 @@ def set_schema_version(conn: sqlite3.Connection, version: int) -> None:
 
 def _column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
     """Check if a column exists in a table."""
-    cursor = conn.execute(f"PRAGMA table_info({table})")
+    # table_xinfo also lists generated columns, which table_info hides
+    cursor = conn.execute(f"PRAGMA table_xinfo({table})")
     return any(row[1] == column for row in cursor.fetchall())
 
 
@@ -469,6 +505,14 @@ def apply_migrations(conn: sqlite3.Connection) -> int:
                 conn.execute("ALTER TABLE item_history ADD COLUMN parent_id_old INTEGER")
             if version == 10 and not _column_exists(conn, "tags", "kind"):
                 conn.execute("ALTER TABLE tags ADD COLUMN kind TEXT NOT NULL DEFAULT 'ad-hoc'")
+            if version == 13:
+                for column in ITEM_METADATA_COLUMNS:
+                    if not _column_exists(conn, "items", column):
+                        conn.execute(
+                            f"ALTER TABLE items ADD COLUMN {column} TEXT GENERATED ALWAYS AS "
+                            f"(CASE WHEN json_valid(metadata) "
+                            f"THEN json_extract(metadata, '$.{column}') END) VIRTUAL"
+                        )
             conn.executescript(sql)
             set_schema_version(conn, version)
             conn.commit()
@@ -480,10 +524,14 @@ def apply_migrations(conn: sqlite3.Connection) -> int:
 
 def init_database(config: Config | None = None) -> None:
     """Initialize the database with schema and apply migrations."""
+    config = config or Config.load()
     db_path = get_db_path(config)
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with sqlite3.connect(db_path) as conn:
+    with closing(sqlite3.connect(db_path)) as conn:
+        # New databases start in the configured journal mode (WAL persists)
+        _apply_pragmas(conn, config.sqlite)
+
         # Apply base schema
         conn.executescript(SCHEMA)
         conn.commit()
@@ -492,20 +540,35 @@ def init_database(config: Config | None = None) -> None:
         apply_migrations(conn)
 
 
+def _apply_pragmas(conn: sqlite3.Connection, sqlite_config: SQLiteConfig) -> None:
+    """Apply the per-connection PRAGMAs from the ``[sqlite]`` config section."""
+    conn.executescript(
+        f"""
+        PRAGMA foreign_keys = ON;
+        PRAGMA journal_mode = {sqlite_config.journal_mode};
+        PRAGMA synchronous = {sqlite_config.synchronous};
+        PRAGMA cache_size = {-sqlite_config.cache_size_kb};
+        PRAGMA temp_store = {sqlite_config.temp_store};
+        PRAGMA mmap_size = {sqlite_config.mmap_size_mb * 1024 * 1024};
+        """
+    )
+
+
 @contextmanager
 def get_connection(config: Config | None = None) -> Iterator[sqlite3.Connection]:
     """Get a database connection.
 
     Automatically initializes database if needed and applies pending migrations.
     """
+    config = config or Config.load()
     db_path = get_db_path(config)
     if not db_path.exists():
         init_database(config)
 
-    conn = sqlite3.connect(db_path)
+    sqlite_config = config.sqlite
+    conn = sqlite3.connect(db_path, timeout=sqlite_config.busy_timeout_ms / 1000)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
-    conn.execute("PRAGMA journal_mode = WAL")
+    _apply_pragmas(conn, sqlite_config)
 
     # Apply any pending migrations
     current_version = get_schema_version(conn)
@@ -518,6 +581,66 @@ def get_connection(config: Config | None = None) -> Iterator[sqlite3.Connection]
         conn.close()
 
 
+@contextmanager
+def write_batch(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Group several writes into one ``BEGIN IMMEDIATE`` transaction.
+
+    Commits once on exit and rolls back if the block raises, so helpers that
+    leave committing to the caller can be batched without a commit per row.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+@contextmanager
+def get_readonly_connection(config: Config | None = None) -> Iterator[sqlite3.Connection]:
+    """Get a read-only database connection for commands that never write.
+
+    Opened with ``mode=ro`` so it never takes the write lock; in WAL mode it
+    reads the last committed snapshot while a sync is writing. A missing or
+    outdated database is first brought up to date through ``get_connection``.
+    """
+    config = config or Config.load()
+    db_path = get_db_path(config)
+    sqlite_config = config.sqlite
+
+    def connect() -> sqlite3.Connection:
+        return sqlite3.connect(
+            f"{db_path.as_uri()}?mode=ro",
+            uri=True,
+            timeout=sqlite_config.busy_timeout_ms / 1000,
+        )
+
+    if not db_path.exists():
+        with get_connection(config):
+            pass
+    conn = connect()
+    if get_schema_version(conn) < SCHEMA_VERSION:
+        conn.close()
+        with get_connection(config):
+            pass
+        conn = connect()
+
+    conn.row_factory = sqlite3.Row
+    conn.executescript(
+        f"""
+        PRAGMA cache_size = {-sqlite_config.cache_size_kb};
+        PRAGMA temp_store = {sqlite_config.temp_store};
+        PRAGMA mmap_size = {sqlite_config.mmap_size_mb * 1024 * 1024};
+        """
+    )
+
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
 def get_person_profile(conn: sqlite3.Connection, urn: str) -> dict | None:
     """Look up a person profile by URN.
 
@@ -538,6 +661,32 @@ def get_person_profile(conn: sqlite3.Connection, urn: str) -> dict | None:
     return None
 
 
+# Keys per IN (...) query in batch lookups, well under SQLite's bound
+# parameter limit (999 before 3.32)
+IN_BATCH_SIZE = 500
+
+
+def _select_in_batches(conn: sqlite3.Connection, sql: str, keys: list[str]) -> list[sqlite3.Row]:
+    """Run ``sql`` (with an ``{placeholders}`` slot) over ``keys`` in IN-list batches."""
+    rows: list[sqlite3.Row] = []
+    for start in range(0, len(keys), IN_BATCH_SIZE):
+        batch = keys[start : start + IN_BATCH_SIZE]
+        placeholders = ",".join("?" for _ in batch)
+        rows.extend(conn.execute(sql.format(placeholders=placeholders), batch))
+    return rows
+
+
+def get_person_profiles(conn: sqlite3.Connection, urns: list[str]) -> dict[str, dict]:
+    """Batch-fetch person profiles. Returns {urn: profile_dict} for URNs that exist."""
+    rows = _select_in_batches(
+        conn,
+        """SELECT urn, profile_url, display_name, source
+           FROM person_profiles WHERE urn IN ({placeholders})""",
+        urns,
+    )
+    return {row["urn"]: dict(row) for row in rows}
+
+
 def upsert_person_profile(
     conn: sqlite3.Connection,
     urn: str,
@@ -553,6 +702,8 @@ def upsert_person_profile(
         profile_url: LinkedIn profile URL (e.g., "https://linkedin.com/in/john-doe")
         display_name: Human-readable name
         source: How the mapping was obtained (manual, api, etc.)
+
+    Does NOT call conn.commit() — caller must commit.
     """
     conn.execute(
         """
@@ -566,7 +717,6 @@ def upsert_person_profile(
         """,
         (urn, profile_url, display_name, source),
     )
-    conn.commit()
 
 
 def list_person_profiles(conn: sqlite3.Connection) -> list[dict]:
@@ -585,11 +735,12 @@ def list_person_profiles(conn: sqlite3.Connection) -> list[dict]:
 def delete_person_profile(conn: sqlite3.Connection, urn: str) -> bool:
     """Delete a person profile mapping.
 
+    Does NOT call conn.commit() — caller must commit.
+
     Returns:
         True if a profile was deleted, False if not found
     """
     cursor = conn.execute("DELETE FROM person_profiles WHERE urn = ?", (urn,))
-    conn.commit()
     return cursor.rowcount > 0
 
 
@@ -603,11 +754,9 @@ def upsert_item(conn: sqlite3.Connection, item: ItemCreate) -> int:
     Returns:
         The item ID of the inserted or updated row.
     """
-    import json
-
     metadata_json = json.dumps(item.metadata) if item.metadata else None
     pre_max = max_history_id(conn)
-    conn.execute(
+    row = conn.execute(
         """
         INSERT INTO items (
             source_type, source_id, url, title, content,
@@ -624,6 +773,7 @@ def upsert_item(conn: sqlite3.Connection, item: ItemCreate) -> int:
            OR excluded.author IS NOT items.author
            OR excluded.metadata IS NOT items.metadata
            OR excluded.parent_id IS NOT items.parent_id
+        RETURNING id
         """,
         (
             item.source_type,
@@ -637,12 +787,14 @@ def upsert_item(conn: sqlite3.Connection, item: ItemCreate) -> int:
             metadata_json,
             item.parent_id,
         ),
-    )
-
-    row = conn.execute(
-        "SELECT id FROM items WHERE source_type = ? AND source_id = ?",
-        (item.source_type, item.source_id),
     ).fetchone()
+    if row is None:
+        # Unchanged re-sync: the DO UPDATE's WHERE skipped the row, so
+        # RETURNING produced nothing and the id has to be looked up.
+        row = conn.execute(
+            "SELECT id FROM items WHERE source_type = ? AND source_id = ?",
+            (item.source_type, item.source_id),
+        ).fetchone()
     item_id = row[0]
 
     mark_recent_history(conn, pre_max, "sync", item_ids=[item_id])
@@ -771,6 +923,166 @@ def get_post_cache(conn: sqlite3.Connection, urn: str) -> dict | None:
     return None
 
 
+def get_post_caches(conn: sqlite3.Connection, urns: list[str]) -> dict[str, dict]:
+    """Batch-fetch cached posts. Returns {urn: post_dict} for URNs that exist."""
+    rows = _select_in_batches(
+        conn,
+        """SELECT urn, author_urn, author_name, content_preview, full_content,
+                  image_path, url, created_at, fetched_at, source, reactor_name
+           FROM post_cache WHERE urn IN ({placeholders})""",
+        urns,
+    )
+    return {row["urn"]: dict(row) for row in rows}
+
+
+# Synced items are written in chunks of this size, one transaction per chunk
+SYNC_BATCH_SIZE = 500
+
+# Upsert used for synced items; unlike upsert_item it always refreshes the
+# row, including url and is_own_content. A parent_id already set on the row
+# (by a resolver or through the API) is kept when the plugin sends none.
+_UPSERT_SYNCED_ITEM = """
+    INSERT INTO items (
+        source_type, source_id, url, title, content,
+        author, created_at, is_own_content, metadata, parent_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(source_type, source_id) DO UPDATE SET
+        url = excluded.url,
+        title = excluded.title,
+        content = excluded.content,
+        author = excluded.author,
+        is_own_content = excluded.is_own_content,
+        metadata = excluded.metadata,
+        parent_id = coalesce(excluded.parent_id, items.parent_id)
+"""
+
+
+def _synced_item_params(item: ItemCreate) -> tuple:
+    """Bind parameters for ``_UPSERT_SYNCED_ITEM``."""
+    return (
+        item.source_type,
+        item.source_id,
+        item.url,
+        item.title,
+        item.content,
+        item.author,
+        item.created_at,
+        item.is_own_content,
+        json.dumps(item.metadata) if item.metadata else None,
+        item.parent_id,
+    )
+
+
+def upsert_items_batch(conn: sqlite3.Connection, items: Sequence[ItemCreate]) -> tuple[int, int]:
+    """Insert or update a batch of synced items, and their media, in one transaction.
+
+    Keyed rows are written with a single ``executemany`` inside ``write_batch``,
+    so a failure part-way through rolls the whole chunk back. Items without a
+    ``source_id`` never conflict and are inserted one at a time. When the
+    connection is already in a transaction the caller owns it and must commit.
+
+    Args:
+        conn: Database connection.
+        items: Items to persist (typically one sync chunk).
+
+    Returns:
+        ``(added, updated)`` counts; items already stored count as updated.
+    """
+    if not items:
+        return 0, 0
+    keyed = [item for item in items if item.source_id is not None]
+    unkeyed = [item for item in items if item.source_id is None]
+
+    with nullcontext(conn) if conn.in_transaction else write_batch(conn):
+        keys = list({(item.source_type, item.source_id) for item in keyed})
+        existing = 0
+        for start in range(0, len(keys), IN_BATCH_SIZE):
+            chunk = keys[start : start + IN_BATCH_SIZE]
+            placeholders = ", ".join("(?, ?)" for _ in chunk)
+            existing += conn.execute(
+                "SELECT COUNT(*) FROM items"
+                f" WHERE (source_type, source_id) IN (VALUES {placeholders})",
+                [value for key in chunk for value in key],
+            ).fetchone()[0]
+
+        conn.executemany(_UPSERT_SYNCED_ITEM, [_synced_item_params(item) for item in keyed])
+
+        with_media: list[tuple[int, ItemCreate]] = []
+        for item in keyed:
+            if not item.media:
+                continue
+            row = conn.execute(
+                "SELECT id FROM items WHERE source_type = ? AND source_id = ?",
+                (item.source_type, item.source_id),
+            ).fetchone()
+            if row:
+                with_media.append((row[0], item))
+        for item in unkeyed:
+            cursor = conn.execute(_UPSERT_SYNCED_ITEM, _synced_item_params(item))
+            if item.media and cursor.lastrowid is not None:
+                with_media.append((cursor.lastrowid, item))
+
+        for item_id, item in with_media:
+            for media in item.media or ():
+                add_item_media(
+                    conn,
+                    item_id,
+                    media_type=media.media_type,
+                    url=media.url,
+                    local_path=media.local_path,
+                    mime_type=media.mime_type,
+                    alt_text=media.alt_text,
+                    position=media.position,
+                    source_origin=media.source_origin,
+                    _commit=False,
+                )
+
+    return len(keys) - existing + len(unkeyed), existing
+
+
+def upsert_items_stream(
+    conn: sqlite3.Connection,
+    items: Iterable[ItemCreate],
+    batch_size: int = SYNC_BATCH_SIZE,
+    lock: AbstractContextManager[object] | None = None,
+) -> tuple[int, int]:
+    """Upsert items streamed from a plugin, returning ``(added, updated)`` counts.
+
+    Items are buffered and written with ``upsert_items_batch`` in chunks of
+    ``batch_size``, committing after each chunk, with ``lock`` held around
+    every write. If the plugin raises, the items it yielded so far are still
+    written before the error propagates.
+    """
+    added = updated = 0
+    batch: list[ItemCreate] = []
+
+    def flush() -> None:
+        nonlocal added, updated
+        with lock or nullcontext():
+            batch_added, batch_updated = upsert_items_batch(conn, batch)
+        added += batch_added
+        updated += batch_updated
+        batch.clear()
+
+    try:
+        for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                flush()
+    except Exception as plugin_error:
+        # Keep whatever the plugin yielded before it failed, but report the
+        # plugin's error even if that final write fails too
+        if batch:
+            try:
+                flush()
+            except Exception as flush_error:
+                raise plugin_error from flush_error
+        raise
+    if batch:
+        flush()
+    return added, updated
+
+
 def upsert_post_cache(
     conn: sqlite3.Connection,
     urn: str,
@@ -63,7 +63,12 @@ def _serialize_embedding(embedding: list[float]) -> bytes:
 
 
 def load_vec_extension(conn: sqlite3.Connection) -> None:
-    """Load the sqlite-vec extension into a connection."""
+    """Load the sqlite-vec extension into a connection (no-op if already loaded)."""
+    try:
+        conn.execute("SELECT vec_version()")
+        return
+    except sqlite3.OperationalError:
+        pass
     conn.enable_load_extension(True)
     sqlite_vec.load(conn)
     conn.enable_load_extension(False)
@@ -127,7 +132,6 @@ def re_embed_item(conn: sqlite3.Connection, item_id: int) -> bool:
     if not text:
         return False
     try:
-        load_vec_extension(conn)
         ensure_vec_table(conn)
         embedding = embed_text(text)
         upsert_embedding(conn, item_id, embedding)
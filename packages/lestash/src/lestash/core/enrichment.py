@@ -5,37 +5,126 @@ and preview text. Used by both the CLI and the API server.
 """
 
 import sqlite3
-
-from lestash.core.database import get_person_profile, get_post_cache
+from collections.abc import Iterable
+
+from lestash.core.database import (
+    get_person_profile,
+    get_person_profiles,
+    get_post_cache,
+    get_post_caches,
+)
 from lestash.models.item import Item
 
+ProfileCache = dict[str, dict | None]
+PostCache = dict[str, dict | None]
+
+
+def lookup_profile(
+    conn: sqlite3.Connection, urn: str, profile_cache: ProfileCache | None = None
+) -> dict | None:
+    """Look up a person profile, memoizing the result in ``profile_cache``.
+
+    Listings repeat the same few authors across many rows, so callers that
+    render several items pass a shared dict to query each URN only once.
+    """
+    if profile_cache is None:
+        return get_person_profile(conn, urn)
+    if urn not in profile_cache:
+        profile_cache[urn] = get_person_profile(conn, urn)
+    return profile_cache[urn]
+
+
+def prefetch_profiles(conn: sqlite3.Connection, items: Iterable[Item]) -> ProfileCache:
+    """Load the profiles for every author and actor URN in ``items`` at once.
+
+    Returns a profile cache for get_author_actor()/resolve_author(), with
+    None recorded for URNs that have no profile so they are not re-queried.
+    """
+    urns: set[str] = set()
+    for item in items:
+        if item.author:
+            urns.add(item.author)
+        actor = (item.metadata or {}).get("raw", {}).get("actor")
+        if actor:
+            urns.add(actor)
+    profiles = get_person_profiles(conn, list(urns))
+    return {urn: profiles.get(urn) for urn in urns}
+
+
+def lookup_post(
+    conn: sqlite3.Connection, urn: str, post_cache: PostCache | None = None
+) -> dict | None:
+    """Look up cached post content, memoizing the result in ``post_cache``."""
+    if post_cache is None:
+        return get_post_cache(conn, urn)
+    if urn not in post_cache:
+        post_cache[urn] = get_post_cache(conn, urn)
+    return post_cache[urn]
+
+
+def _target_urn(item: Item) -> str | None:
+    """The reaction or comment target of ``item``, if any."""
+    if not item.metadata:
+        return None
+    return item.metadata.get("reacted_to") or item.metadata.get("commented_on")
+
+
+def prefetch_post_cache(conn: sqlite3.Connection, items: Iterable[Item]) -> PostCache:
+    """Load the cached posts for every reaction/comment target in ``items`` at once.
+
+    Returns a post cache for get_author_actor()/get_preview(), with None
+    recorded for targets that have not been cached.
+    """
+    urns = {urn for item in items if (urn := _target_urn(item))}
+    posts = get_post_caches(conn, list(urns))
+    return {urn: posts.get(urn) for urn in urns}
+
 
-def resolve_author(conn: sqlite3.Connection, author: str | None) -> str:
+def resolve_author(
+    conn: sqlite3.Connection,
+    author: str | None,
+    profile_cache: ProfileCache | None = None,
+) -> str:
     """Resolve author URN to display name if available."""
     if not author:
         return "-"
-    profile = get_person_profile(conn, author)
+    profile = lookup_profile(conn, author, profile_cache)
     if profile and profile.get("display_name"):
         return profile["display_name"]
     return author
 
 
-def get_author_actor(conn: sqlite3.Connection, item: Item) -> tuple[str, str]:
+def get_author_actor(
+    conn: sqlite3.Connection,
+    item: Item,
+    profile_cache: ProfileCache | None = None,
+    post_cache: PostCache | None = None,
+) -> tuple[str, str]:
     """Extract author and actor for display.
 
     For reactions:
     - Author = who wrote the content being reacted to
     - Actor = who made the reaction
 
+    Args:
+        conn: Database connection
+        item: Item to describe
+        profile_cache: Optional per-listing cache of person profiles by URN
+        post_cache: Optional per-listing cache of post_cache rows by URN
+
     Returns:
         Tuple of (author_display, actor_display)
     """
-    raw = item.metadata.get("raw", {}) if item.metadata else {}
+    if not item.metadata:
+        # No reaction data: the actor is unknown and the author is the item's own
+        return resolve_author(conn, item.author, profile_cache), "-"
+
+    raw = item.metadata.get("raw", {})
     owner_urn = raw.get("owner")
     actor_urn = raw.get("actor")
 
     # Resolve actor URN
-    actor_display = resolve_author(conn, actor_urn) if actor_urn else "-"
+    actor_display = resolve_author(conn, actor_urn, profile_cache) if actor_urn else "-"
 
     # Determine author based on scenario
     if owner_urn and actor_urn and owner_urn != actor_urn:
@@ -44,17 +133,13 @@ def get_author_actor(conn: sqlite3.Connection, item: Item) -> tuple[str, str]:
     else:
         # You reacted to someone else's content
         # Try to get author from post_cache enrichment
-        target_urn = (
-            item.metadata.get("reacted_to") or item.metadata.get("commented_on")
-            if item.metadata
-            else None
-        )
+        target_urn = _target_urn(item)
         if target_urn:
-            cached = get_post_cache(conn, target_urn)
+            cached = lookup_post(conn, target_urn, post_cache)
             author_display = cached["author_name"] if cached and cached.get("author_name") else "-"
         else:
             # Not a reaction/comment - fall back to item.author
-            author_display = resolve_author(conn, item.author)
+            author_display = resolve_author(conn, item.author, profile_cache)
 
     return author_display, actor_display
 
@@ -102,53 +187,62 @@ def get_item_subtype(item: Item) -> str:
     return source
 
 
-def get_preview(conn: sqlite3.Connection, item: Item, max_length: int = 50) -> str:
+def get_preview(
+    conn: sqlite3.Connection,
+    item: Item,
+    max_length: int = 50,
+    fallback: str | None = None,
+    post_cache: PostCache | None = None,
+) -> str:
     """Get preview text for display.
 
     For reactions (LIKE, CELEBRATE, etc.) and comments, if we have cached
     content for the target, show that content instead of the activity URN.
+
+    ``fallback`` is a precomputed standard preview (e.g. from SQL); when given
+    it replaces the title/content truncation below. ``post_cache`` is an
+    optional per-listing cache of post_cache rows by URN.
     """
     # Check if this is a reaction or comment with a target
-    if item.metadata:
-        target_urn = item.metadata.get("reacted_to") or item.metadata.get("commented_on")
-        if target_urn:
-            # Detect if target is a comment or post
-            is_comment_target = target_urn.startswith("urn:li:comment:")
-
-            # Look up cached content
-            cached = get_post_cache(conn, target_urn)
-            if cached and cached.get("content_preview"):
-                # Extract emoji and reaction type from original content
-                # Format: "👍 LIKE on activity:123" -> "👍 LIKE"
-                original = item.content
-                parts = original.split(" on ")
-                prefix = parts[0] if parts else ""
-
-                # Add "(comment)" indicator for comment reactions
-                if is_comment_target:
-                    prefix = f"{prefix} (comment)"
-
-                # Check if this is a reaction from someone else (has reactor_name)
-                if cached.get("reactor_name"):
-                    prefix = f"{prefix} from {cached['reactor_name']}"
-
-                # Build new preview with cached content
-                cached_preview = cached["content_preview"][:max_length]
-                if len(cached["content_preview"]) > max_length:
-                    cached_preview += "..."
-
-                return f'{prefix}: "{cached_preview}"'
-
-            # Not enriched but is a comment reaction - add indicator to original content
-            if is_comment_target and " on " in item.content:
-                parts = item.content.split(" on ", 1)
-                if len(parts) == 2:
-                    preview = f"{parts[0]} (comment) on {parts[1]}"
-                    if len(preview) > max_length:
-                        return preview[:max_length] + "..."
-                    return preview
+    target_urn = _target_urn(item)
+    if target_urn:
+        # Detect if target is a comment or post
+        is_comment_target = target_urn.startswith("urn:li:comment:")
+
+        # Look up cached content
+        cached = lookup_post(conn, target_urn, post_cache)
+        if cached and cached.get("content_preview"):
+            # Extract emoji and reaction type from original content
+            # Format: "👍 LIKE on activity:123" -> "👍 LIKE"
+            prefix = item.content.partition(" on ")[0]
+
+            # Add "(comment)" indicator for comment reactions
+            if is_comment_target:
+                prefix = f"{prefix} (comment)"
+
+            # Check if this is a reaction from someone else (has reactor_name)
+            if cached.get("reactor_name"):
+                prefix = f"{prefix} from {cached['reactor_name']}"
+
+            # Build new preview with cached content
+            cached_preview = cached["content_preview"][:max_length]
+            if len(cached["content_preview"]) > max_length:
+                cached_preview += "..."
+
+            return f'{prefix}: "{cached_preview}"'
+
+        # Not enriched but is a comment reaction - add indicator to original content
+        if is_comment_target:
+            action, sep, target = item.content.partition(" on ")
+            if sep:
+                preview = f"{action} (comment) on {target}"
+                if len(preview) > max_length:
+                    return preview[:max_length] + "..."
+                return preview
 
     # Fall back to standard preview
+    if fallback is not None:
+        return fallback
     if item.title:
         return item.title
     elif len(item.content) > max_length:
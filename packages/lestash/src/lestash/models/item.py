@@ -1,9 +1,24 @@
 """Item model for Le Stash."""
 
+import json
 from datetime import datetime
 from typing import Any
 
 from pydantic import BaseModel
+from pydantic_core import from_json
+
+
+def load_metadata(raw: str | bytes) -> Any:
+    """Decode a stored metadata JSON column.
+
+    pydantic-core's parser is several times faster than ``json.loads`` on
+    wide payloads; anything it rejects (e.g. lone surrogate escapes) falls
+    back to the stdlib decoder.
+    """
+    try:
+        return from_json(raw)
+    except ValueError:
+        return json.loads(raw)
 
 
 class MediaCreate(BaseModel):
@@ -73,9 +88,27 @@ class Item(BaseModel):
     @classmethod
     def from_row(cls, row: Any) -> "Item":
         """Create an Item from a database row."""
-        import json
-
         data = dict(row)
         if data.get("metadata"):
-            data["metadata"] = json.loads(data["metadata"])
+            data["metadata"] = load_metadata(data["metadata"])
         return cls(**data)
+
+    @classmethod
+    def preview_from_row(cls, row: Any) -> "Item":
+        """Create an Item from a trusted database row without validation.
+
+        For read-only listings that render many rows: skips pydantic
+        validation and converts only what the display helpers read (metadata
+        JSON and timestamps). The row may be a partial projection.
+        """
+        data = dict(row)
+        if data.get("metadata"):
+            data["metadata"] = load_metadata(data["metadata"])
+        for key in ("created_at", "fetched_at"):
+            value = data.get(key)
+            if isinstance(value, str):
+                try:
+                    data[key] = datetime.fromisoformat(value)
+                except ValueError:
+                    data[key] = None
+        return cls.model_construct(**data)
@@ -1,30 +1,57 @@
 """Plugin discovery and loading."""
 
+import functools
 import time
-from importlib.metadata import entry_points
+from collections.abc import Collection
+from importlib.metadata import EntryPoints, entry_points
 
 from lestash.core.logging import get_logger
 from lestash.plugins.base import SourcePlugin
 
 logger = get_logger("plugins.loader")
 
+# Plugin instances already loaded in this process, by entry point name
+_loaded: dict[str, SourcePlugin] = {}
 
-def load_plugins() -> dict[str, SourcePlugin]:
-    """Discover and load all installed source plugins.
+
+@functools.cache
+def _source_entry_points() -> EntryPoints:
+    """Scan installed distributions for source plugins once per process."""
+    return entry_points(group="lestash.sources")
+
+
+def plugin_names() -> list[str]:
+    """Entry point names of the installed source plugins, without importing them."""
+    return [ep.name for ep in _source_entry_points()]
+
+
+def load_plugins(names: Collection[str] | None = None) -> dict[str, SourcePlugin]:
+    """Discover and load installed source plugins.
+
+    Args:
+        names: Only import the plugins with these entry point names
+            (default: all installed plugins).
 
     Returns:
         Dictionary mapping plugin names to plugin instances.
+
+    Plugins are imported and instantiated once per process; later calls
+    reuse the same instances. Plugins that failed to load are retried.
     """
     plugins: dict[str, SourcePlugin] = {}
 
-    eps = entry_points(group="lestash.sources")
-    for ep in eps:
+    for ep in _source_entry_points():
+        if names is not None and ep.name not in names:
+            continue
+        if ep.name in _loaded:
+            plugins[ep.name] = _loaded[ep.name]
+            continue
         try:
             start_time = time.time()
             plugin_class = ep.load()
             plugin = plugin_class()
             elapsed = (time.time() - start_time) * 1000  # Convert to milliseconds
-            plugins[ep.name] = plugin
+            plugins[ep.name] = _loaded[ep.name] = plugin
             logger.debug(f"Loaded plugin '{ep.name}' ({elapsed:.1f}ms)")
         except Exception as e:
             logger.warning(f"Failed to load plugin '{ep.name}': {e}")
@@ -0,0 +1,96 @@
+"""Tests for the `lestash config` CLI commands."""
+
+import tomllib
+
+import pytest
+from lestash.cli.config import app
+from lestash.core.config import Config
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    """Point the config directory at a temporary path."""
+    monkeypatch.setattr("lestash.core.config.get_config_dir", lambda: tmp_path)
+    return tmp_path
+
+
+class TestShowConfig:
+    def test_show_without_config_file(self, config_dir):
+        result = runner.invoke(app, ["show"])
+        assert result.exit_code == 0
+        assert "No config file" in result.output
+
+    def test_show_renders_sections_and_values(self, config_dir):
+        runner.invoke(app, ["init"])
+
+        result = runner.invoke(app, ["show"])
+
+        assert result.exit_code == 0
+        assert "[general]" in result.output
+        assert "[logging]" in result.output
+        assert "console_enabled = true" in result.output
+
+
+class TestSetConfig:
+    def test_set_updates_value(self, config_dir):
+        result = runner.invoke(app, ["set", "logging.level", "DEBUG"])
+
+        assert result.exit_code == 0
+        data = tomllib.loads((config_dir / "config.toml").read_text())
+        assert data["logging"]["level"] == "DEBUG"
+
+    @pytest.mark.parametrize("key", ["level", "logging.", ".level", "logging.filters.httpx"])
+    def test_set_rejects_malformed_key(self, config_dir, key):
+        result = runner.invoke(app, ["set", key, "DEBUG"])
+        assert result.exit_code == 1
+        assert "section.key" in result.output
+
+    def test_set_rejects_invalid_value(self, config_dir):
+        result = runner.invoke(app, ["set", "logging.level", "LOUD"])
+        assert result.exit_code == 1
+        assert not (config_dir / "config.toml").exists()
+
+    def test_set_coerces_value_to_field_type(self, config_dir):
+        result = runner.invoke(app, ["set", "logging.db_enabled", "true"])
+
+        assert result.exit_code == 0
+        data = tomllib.loads((config_dir / "config.toml").read_text())
+        assert data["logging"]["db_enabled"] is True
+
+    def test_set_preserves_other_sections(self, config_dir):
+        runner.invoke(app, ["set", "general.database_path", "/tmp/other.db"])
+        runner.invoke(app, ["set", "logging.level", "ERROR"])
+
+        data = tomllib.loads((config_dir / "config.toml").read_text())
+        assert data["general"]["database_path"] == "/tmp/other.db"
+        assert data["logging"]["level"] == "ERROR"
+
+    def test_set_rejects_unknown_section_or_key(self, config_dir):
+        assert runner.invoke(app, ["set", "nosuch.level", "DEBUG"]).exit_code == 1
+        assert runner.invoke(app, ["set", "logging.nosuch", "DEBUG"]).exit_code == 1
+        assert not (config_dir / "config.toml").exists()
+
+
+class TestLoadCache:
+    def test_load_reuses_parsed_config_until_saved(self, config_dir):
+        runner.invoke(app, ["init"])
+        first = Config.load()
+        assert Config.load() is first
+
+        runner.invoke(app, ["set", "logging.level", "ERROR"])
+        reloaded = Config.load()
+        assert reloaded is not first
+        assert reloaded.logging.level == "ERROR"
+
+    def test_plugin_sections_are_kept(self, config_dir):
+        (config_dir / "config.toml").write_text("[youtube]\nmax_results = 5\n")
+        assert Config.load().get_plugin_config("youtube") == {"max_results": 5}
+        assert Config.load().get_plugin_config("bluesky") == {}
+
+        runner.invoke(app, ["set", "logging.level", "ERROR"])
+        data = tomllib.loads((config_dir / "config.toml").read_text())
+        assert data["youtube"] == {"max_results": 5}
+        assert data["logging"]["level"] == "ERROR"
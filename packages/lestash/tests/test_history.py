@@ -3,17 +3,23 @@
 import sqlite3
 
 import pytest
+from lestash.core import database
 from lestash.core.database import (
     SCHEMA_VERSION,
     apply_migrations,
+    delete_person_profile,
     get_connection,
     get_db_path,
+    get_readonly_connection,
     get_schema_version,
     mark_recent_history,
     max_history_id,
     upsert_item,
+    upsert_items_batch,
+    upsert_person_profile,
+    write_batch,
 )
-from lestash.models.item import ItemCreate
+from lestash.models.item import ItemCreate, MediaCreate
 
 
 class TestSchemaMigrations:
@@ -92,6 +98,83 @@ class TestSchemaMigrations:
             ).fetchone()
             assert cnt == 0  # cascade fired
 
+    def test_items_metadata_generated_columns(self, test_db):
+        """Migration 13: subtype fields are readable as items columns."""
+        with get_connection(test_db) as conn:
+            upsert_item(
+                conn,
+                ItemCreate(
+                    source_type="linkedin",
+                    source_id="like-1",
+                    content="LIKE",
+                    metadata={
+                        "resource_name": "socialActions/likes",
+                        "reaction_type": "LIKE",
+                        "reacted_to": "urn:li:activity:1",
+                    },
+                ),
+            )
+            conn.execute(
+                "INSERT INTO items (source_type, source_id, content, metadata) "
+                "VALUES ('linkedin', 'bad-1', 'x', '{not json')"
+            )
+            rows = conn.execute(
+                "SELECT source_id, resource_name, reaction_type, reacted_to FROM items ORDER BY id"
+            ).fetchall()
+
+        assert [tuple(row) for row in rows] == [
+            ("like-1", "socialActions/likes", "LIKE", "urn:li:activity:1"),
+            ("bad-1", None, None, None),
+        ]
+
+    def test_connection_applies_sqlite_pragmas(self, test_db):
+        """get_connection should apply the [sqlite] tuning settings."""
+        with get_connection(test_db) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -20000
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+            assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 256 * 1024 * 1024
+
+    def test_readonly_connection_rejects_writes(self, test_db):
+        """get_readonly_connection reads committed data but cannot write."""
+        with get_connection(test_db) as conn:
+            upsert_item(conn, ItemCreate(source_type="test", source_id="ro", content="x"))
+        with get_readonly_connection(test_db) as conn:
+            assert conn.execute("SELECT content FROM items").fetchone()["content"] == "x"
+            with pytest.raises(sqlite3.OperationalError, match="readonly"):
+                conn.execute("DELETE FROM items")
+
+    def test_readonly_connection_migrates_outdated_database(self, test_db):
+        """An outdated database is migrated before the read-only open."""
+        with sqlite3.connect(get_db_path(test_db)) as conn:
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION - 1}")
+        with get_readonly_connection(test_db) as conn:
+            assert get_schema_version(conn) == SCHEMA_VERSION
+
+    def test_write_batch_commits_profile_writes_once(self, test_db):
+        """Profile helpers leave the commit to write_batch."""
+        with get_connection(test_db) as conn:
+            with write_batch(conn):
+                upsert_person_profile(conn, "urn:li:person:a", display_name="Ada")
+                upsert_person_profile(conn, "urn:li:person:b", display_name="Bob")
+                assert delete_person_profile(conn, "urn:li:person:b")
+                assert conn.in_transaction
+            assert not conn.in_transaction
+        with get_readonly_connection(test_db) as conn:
+            urns = [row[0] for row in conn.execute("SELECT urn FROM person_profiles")]
+        assert urns == ["urn:li:person:a"]
+
+    def test_write_batch_rolls_back_on_error(self, test_db):
+        """An exception inside write_batch discards the whole batch."""
+        with get_connection(test_db) as conn:
+            with pytest.raises(RuntimeError), write_batch(conn):
+                upsert_person_profile(conn, "urn:li:person:a", display_name="Ada")
+                raise RuntimeError("boom")
+            assert conn.execute("SELECT COUNT(*) FROM person_profiles").fetchone()[0] == 0
+
     def test_migrations_applied_on_connection(self, test_db):
         """get_connection should automatically apply pending migrations."""
         # Manually reset version to 0 (simulating old database)
@@ -329,6 +412,61 @@ class TestHistoryWithUpsert:
             assert history[0] == "CREATE ugcPosts"
             assert history[1] is None
 
+    def test_upsert_item_returns_same_id_on_resync(self, test_db):
+        """upsert_item returns the row id whether it inserts, updates or skips."""
+        item = ItemCreate(source_type="test", source_id="ids", content="v1")
+        with get_connection(test_db) as conn:
+            item_id = upsert_item(conn, item)
+            assert upsert_item(conn, item) == item_id  # unchanged
+            changed = item.model_copy(update={"content": "v2"})
+            assert upsert_item(conn, changed) == item_id
+
+    def test_upsert_items_batch_counts_and_history(self, test_db):
+        """Batched upserts split added/updated and only changed rows get history."""
+        items = [
+            ItemCreate(source_type="test", source_id=str(n), content=f"v{n}") for n in range(3)
+        ]
+        with get_connection(test_db) as conn:
+            assert upsert_items_batch(conn, items) == (3, 0)
+            resync = [items[0], items[1].model_copy(update={"content": "changed"})]
+            assert upsert_items_batch(conn, resync) == (0, 2)
+            assert not conn.in_transaction
+            rows = conn.execute("SELECT content_old FROM item_history").fetchall()
+            assert [row[0] for row in rows] == ["v1"]
+
+    def test_upsert_items_batch_items_without_source_id(self, test_db):
+        """Items without a source_id are each added, with their media."""
+        media = [MediaCreate(media_type="image", url="https://example.com/a.png")]
+        items = [
+            ItemCreate(source_type="test", content="a", media=media),
+            ItemCreate(source_type="test", content="b"),
+            ItemCreate(source_type="test", source_id="1", content="c"),
+        ]
+        with get_connection(test_db) as conn:
+            assert upsert_items_batch(conn, items) == (3, 0)
+            row = conn.execute(
+                "SELECT i.content FROM item_media m JOIN items i ON i.id = m.item_id"
+            ).fetchone()
+            assert row["content"] == "a"
+
+    def test_upsert_items_batch_rolls_back_on_error(self, test_db, monkeypatch):
+        """A failure part-way through leaves none of the chunk behind."""
+
+        def fail(*args, **kwargs):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(database, "add_item_media", fail)
+        media = [MediaCreate(media_type="image", url="https://example.com/a.png")]
+        items = [
+            ItemCreate(source_type="test", source_id="1", content="a"),
+            ItemCreate(source_type="test", source_id="2", content="b", media=media),
+        ]
+        with get_connection(test_db) as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                upsert_items_batch(conn, items)
+            assert not conn.in_transaction
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
     def test_upsert_insert_does_not_create_history(self, test_db):
         """Upsert that inserts (no conflict) should not create history."""
         with get_connection(test_db) as conn:
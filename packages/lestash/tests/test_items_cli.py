@@ -0,0 +1,299 @@
+"""Smoke tests for the `lestash items` CLI commands."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from lestash.cli.items import app
+from lestash.core.database import get_connection, upsert_item, upsert_person_profile
+from lestash.models.item import ItemCreate
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def items_db(test_db, monkeypatch):
+    """Seed the test database and point the items CLI at it."""
+    monkeypatch.setattr("lestash.cli.items.Config.load", lambda: test_db)
+    # Wide enough that table cells are not wrapped mid-word
+    monkeypatch.setattr("lestash.cli.items.console.width", 200)
+    with get_connection(test_db) as conn:
+        upsert_person_profile(conn, "urn:li:person:ada", display_name="Ada Lovelace")
+        upsert_item(
+            conn,
+            ItemCreate(
+                source_type="linkedin",
+                source_id="post-1",
+                url="https://example.com/post-1",
+                title="Analytical engines",
+                content="Notes on the analytical engine and its programs.",
+                author="urn:li:person:ada",
+                created_at=datetime(2025, 1, 2, 3, 4),
+                is_own_content=True,
+                metadata={"resource_name": "ugcPosts"},
+            ),
+        )
+        upsert_item(
+            conn,
+            ItemCreate(
+                source_type="bluesky",
+                source_id="post-2",
+                content="A short untitled post about difference engines " + "x" * 60,
+                author="someone.bsky.social",
+                created_at=datetime(2025, 1, 1, 9, 30),
+            ),
+        )
+    return test_db
+
+
+class TestListItems:
+    def test_lists_items_with_resolved_author(self, items_db):
+        result = runner.invoke(app, ["list"])
+
+        assert result.exit_code == 0
+        assert "Analytical engines" in result.output
+        assert "Ada Lovelace" in result.output
+        assert "2025-01-02 03:04" in result.output
+
+    def test_shows_stored_wall_time_for_offset_timestamps(self, items_db):
+        with get_connection(items_db) as conn:
+            upsert_item(
+                conn,
+                ItemCreate(
+                    source_type="notes",
+                    source_id="note-tz",
+                    title="Offset note",
+                    content="Written at 09:15 local time.",
+                    created_at=datetime(2025, 1, 4, 9, 15, tzinfo=timezone(timedelta(hours=2))),
+                ),
+            )
+
+        result = runner.invoke(app, ["list", "--source", "notes"])
+
+        assert result.exit_code == 0
+        assert "2025-01-04 09:15" in result.output
+
+    def test_filters_by_source(self, items_db):
+        result = runner.invoke(app, ["list", "--source", "bluesky"])
+
+        assert result.exit_code == 0
+        assert "Analytical engines" not in result.output
+        assert "someone.bsky.social" in result.output
+
+    @pytest.mark.parametrize(
+        ("args", "index"),
+        [
+            ([], "idx_items_created_dt"),
+            (["--source", "bluesky"], "idx_items_source_created"),
+            (["--own"], "idx_items_own_created"),
+            (["--source", "linkedin", "--own"], "idx_items_src_own_created"),
+        ],
+    )
+    def test_debug_prints_index_backed_plan(self, items_db, args, index):
+        result = runner.invoke(app, ["list", "--debug", *args])
+
+        assert result.exit_code == 0
+        assert f"USING INDEX {index}" in result.output
+        assert "TEMP B-TREE" not in result.output
+
+    def test_truncates_untitled_preview(self, items_db):
+        result = runner.invoke(app, ["list", "--source", "bluesky"])
+
+        assert result.exit_code == 0
+        expected = ("A short untitled post about difference engines " + "x" * 60)[:50]
+        assert f"{expected}..." in result.output
+        assert "2025-01-01 09:30" in result.output
+
+
+class TestListColumns:
+    def test_metadata_projection_keeps_only_display_keys(self, test_db):
+        from lestash.cli.items import _LIST_COLUMNS
+
+        metadata = {
+            "resource_name": "socialActions/likes",
+            "reacted_to": "urn:li:activity:1",
+            "raw": {"actor": "urn:li:person:ada", "payload": "x" * 500},
+            "unused": [1, 2, 3],
+        }
+        with get_connection(test_db) as conn:
+            upsert_item(
+                conn,
+                ItemCreate(
+                    source_type="linkedin", source_id="l1", content="LIKE", metadata=metadata
+                ),
+            )
+            upsert_item(
+                conn, ItemCreate(source_type="bluesky", source_id="b1", content="no metadata")
+            )
+            rows = conn.execute(f"SELECT {_LIST_COLUMNS} FROM items ORDER BY id").fetchall()
+
+        assert json.loads(rows[0]["metadata"]) == {
+            "resource_name": "socialActions/likes",
+            "reacted_to": "urn:li:activity:1",
+            "raw": {"actor": "urn:li:person:ada"},
+        }
+        assert rows[1]["metadata"] is None
+
+
+class TestSearchItems:
+    def test_finds_matching_items(self, items_db):
+        result = runner.invoke(app, ["search", "analytical"])
+
+        assert result.exit_code == 0
+        assert "Analytical engines" in result.output
+
+    def test_limit_keeps_only_top_ranked_hits(self, items_db):
+        result = runner.invoke(app, ["search", "engines", "--limit", "1"])
+
+        assert result.exit_code == 0
+        shown = [
+            name for name in ("Analytical engines", "difference engines") if name in result.output
+        ]
+        assert len(shown) == 1
+
+    def test_reports_no_matches(self, items_db):
+        result = runner.invoke(app, ["search", "nonexistentterm"])
+
+        assert result.exit_code == 0
+        assert "No items found" in result.output
+
+
+class TestShowItem:
+    def test_shows_item_details(self, items_db):
+        result = runner.invoke(app, ["show", "1"])
+
+        assert result.exit_code == 0
+        assert "Ada Lovelace" in result.output
+        assert "ugcPosts" in result.output
+
+    def test_metadata_is_printed_verbatim(self, items_db):
+        with get_connection(items_db) as conn:
+            upsert_item(
+                conn,
+                ItemCreate(
+                    source_type="bluesky",
+                    source_id="post-3",
+                    content="Brackets",
+                    metadata={"note": "[bold]not markup[/bold] [/]"},
+                ),
+            )
+
+        result = runner.invoke(app, ["show", "3"])
+
+        assert result.exit_code == 0
+        assert '"note": "[bold]not markup[/bold] [/]"' in result.output
+
+    def test_missing_item_exits_with_error(self, items_db):
+        result = runner.invoke(app, ["show", "999"])
+        assert result.exit_code == 1
+
+
+class TestExportItems:
+    def test_exports_all_items_as_json(self, items_db, tmp_path):
+        output = tmp_path / "export.json"
+
+        result = runner.invoke(app, ["export", "--output", str(output)])
+
+        assert result.exit_code == 0
+        data = json.loads(output.read_text())
+        assert [item["source_id"] for item in data] == ["post-1", "post-2"]
+        assert data[0]["metadata"] == {"resource_name": "ugcPosts"}
+
+    def test_exports_empty_selection(self, items_db, tmp_path):
+        output = tmp_path / "export.json"
+
+        result = runner.invoke(app, ["export", "-o", str(output), "--source", "none"])
+
+        assert result.exit_code == 0
+        assert json.loads(output.read_text()) == []
+
+    def test_limit_exports_newest_items(self, items_db, tmp_path):
+        output = tmp_path / "export.json"
+
+        result = runner.invoke(app, ["export", "-o", str(output), "--limit", "1"])
+
+        assert result.exit_code == 0
+        assert "Exported 1 items" in result.output
+        assert [item["source_id"] for item in json.loads(output.read_text())] == ["post-1"]
+
+    def test_pretty_flag_indents_output(self, items_db, tmp_path):
+        compact = tmp_path / "compact.json"
+        pretty = tmp_path / "pretty.json"
+
+        runner.invoke(app, ["export", "-o", str(compact)])
+        result = runner.invoke(app, ["export", "-o", str(pretty), "--pretty"])
+
+        assert result.exit_code == 0
+        assert json.loads(pretty.read_text()) == json.loads(compact.read_text())
+        assert '\n  "source_type"' in pretty.read_text()
+        assert len(compact.read_text().splitlines()) == 4
+
+    def test_exports_wide_integers_and_non_ascii(self, items_db, tmp_path):
+        output = tmp_path / "export.json"
+        with get_connection(items_db) as conn:
+            upsert_item(
+                conn,
+                ItemCreate(
+                    source_type="notes",
+                    source_id="note-1",
+                    content="Café ☕",
+                    created_at=datetime(2025, 1, 3),
+                    metadata={"big": 2**70},
+                ),
+            )
+
+        result = runner.invoke(app, ["export", "-o", str(output), "--limit", "1"])
+
+        assert result.exit_code == 0
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert data[0]["content"] == "Café ☕"
+        assert data[0]["metadata"] == {"big": 2**70}
+
+
+class TestCreateDraft:
+    def test_writes_draft_with_slugged_name(self, items_db, tmp_path):
+        result = runner.invoke(app, ["draft", "1", "--output", str(tmp_path)])
+
+        assert result.exit_code == 0
+        draft = tmp_path / "draft-linkedin-analytical-engines.md"
+        text = draft.read_text()
+        assert text.startswith('---\ntitle: "Notes on: Analytical engines"\n')
+        assert "*Reference: [Analytical engines](https://example.com/post-1)*" in text
+        assert text.endswith("*Date: 2025-01-02*")
+
+    @pytest.mark.parametrize(
+        ("content", "expected_title"),
+        [
+            ("Short note", "Notes on: Short note"),
+            ("y" * 60, f"Notes on: {'y' * 50}..."),
+            ("Line one\r\nline\ttwo", "Notes on: Line one  line two"),
+        ],
+    )
+    def test_untitled_preview_only_elides_long_content(self, content, expected_title):
+        from lestash.cli.items import _format_microblog_draft
+        from lestash.models.item import Item
+
+        item = Item(id=3, source_type="bluesky", content=content, fetched_at=datetime(2025, 1, 3))
+
+        assert _format_microblog_draft(item).startswith(f'---\ntitle: "{expected_title}"\n')
+
+
+class TestSlugify:
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Hello World", "hello-world"),
+            ("don't stop", "dont-stop"),
+            ("snake_case  and -- dashes", "snake-case-and-dashes"),
+            ("  -Trim me!- ", "trim-me"),
+            ("a . b", "a-b"),
+            ("x" * 60, "x" * 50),
+            ("tab\there\x00", "tab-here"),
+            ("Café — naïve", "café-naïve"),
+        ],
+    )
+    def test_slugify(self, text, expected):
+        from lestash.cli.items import _slugify
+
+        assert _slugify(text) == expected
@@ -9,6 +9,7 @@ from lestash.core.config import Config, GeneralConfig
 from lestash.core.database import (
     get_connection,
     init_database,
+    upsert_person_profile,
     upsert_post_cache,
 )
 from lestash.models.item import Item
@@ -146,6 +147,114 @@ class TestGetAuthorActor:
         assert author == "urn:li:person:author123"
         assert actor == "-"
 
+    def test_profile_cache_reuses_lookups(self, test_db):
+        """A shared profile cache resolves each URN once and memoizes misses."""
+        from lestash.core.enrichment import get_author_actor
+
+        items = [
+            make_item(id=i, author="urn:li:person:author123", metadata={"resource_name": "x"})
+            for i in range(3)
+        ]
+        profile_cache: dict = {}
+
+        with get_connection(test_db) as conn:
+            upsert_person_profile(conn, "urn:li:person:author123", display_name="Ada")
+            statements: list[str] = []
+            conn.set_trace_callback(statements.append)
+            results = [get_author_actor(conn, item, profile_cache) for item in items]
+            conn.set_trace_callback(None)
+
+        assert results == [("Ada", "-")] * 3
+        assert sum("person_profiles" in sql for sql in statements) == 1
+        assert set(profile_cache) == {"urn:li:person:author123"}
+
+    def test_prefetch_profiles_batches_authors_and_actors(self, test_db):
+        """prefetch_profiles loads every author/actor URN in a single query."""
+        from lestash.core.enrichment import get_author_actor, prefetch_profiles
+
+        items = [
+            make_item(id=1, author="urn:li:person:a", metadata={"resource_name": "x"}),
+            make_item(
+                id=2,
+                metadata={
+                    "reacted_to": "urn:li:activity:1",
+                    "raw": {"owner": "urn:li:person:me", "actor": "urn:li:person:b"},
+                },
+            ),
+        ]
+
+        with get_connection(test_db) as conn:
+            upsert_person_profile(conn, "urn:li:person:a", display_name="Ada")
+            statements: list[str] = []
+            conn.set_trace_callback(statements.append)
+            profile_cache = prefetch_profiles(conn, items)
+            results = [get_author_actor(conn, item, profile_cache) for item in items]
+            conn.set_trace_callback(None)
+
+        assert profile_cache["urn:li:person:a"]["display_name"] == "Ada"
+        assert profile_cache["urn:li:person:b"] is None
+        assert results == [("Ada", "-"), ("You", "urn:li:person:b")]
+        assert sum("person_profiles" in sql for sql in statements) == 1
+
+    def test_prefetch_post_cache_batches_targets(self, test_db):
+        """prefetch_post_cache loads every reaction/comment target in one query."""
+        from lestash.core.enrichment import (
+            get_author_actor,
+            get_preview,
+            prefetch_post_cache,
+        )
+
+        items = [
+            make_item(
+                id=1, content="👍 LIKE on activity:1", metadata={"reacted_to": "urn:li:activity:1"}
+            ),
+            make_item(id=2, content="Comment", metadata={"commented_on": "urn:li:activity:2"}),
+            make_item(id=3, content="Plain post"),
+        ]
+
+        with get_connection(test_db) as conn:
+            upsert_post_cache(
+                conn, "urn:li:activity:1", content_preview="Cached post", author_name="Bob"
+            )
+            statements: list[str] = []
+            conn.set_trace_callback(statements.append)
+            post_cache = prefetch_post_cache(conn, items)
+            previews = [get_preview(conn, item, post_cache=post_cache) for item in items]
+            authors = [get_author_actor(conn, item, {}, post_cache)[0] for item in items[:2]]
+            conn.set_trace_callback(None)
+
+        assert post_cache["urn:li:activity:2"] is None
+        assert previews[0] == '👍 LIKE: "Cached post"'
+        assert authors == ["Bob", "-"]
+        assert sum("post_cache" in sql for sql in statements) == 1
+
+
+class TestBatchLookups:
+    """Test IN-list batching of profile and post_cache lookups."""
+
+    def test_lookups_are_split_into_batches(self, test_db, monkeypatch):
+        from lestash.core import database
+        from lestash.core.database import get_person_profiles, get_post_caches
+
+        monkeypatch.setattr(database, "IN_BATCH_SIZE", 2)
+        urns = [f"urn:li:person:{i}" for i in range(5)]
+        with get_connection(test_db) as conn:
+            for urn in urns:
+                upsert_person_profile(conn, urn, display_name=urn[-1])
+            upsert_post_cache(conn, "urn:li:activity:1", content_preview="Post")
+            statements: list[str] = []
+            conn.set_trace_callback(statements.append)
+            profiles = get_person_profiles(conn, urns)
+            posts = get_post_caches(conn, ["urn:li:activity:1", "urn:li:activity:2"])
+            empty = get_person_profiles(conn, [])
+            conn.set_trace_callback(None)
+
+        assert set(profiles) == set(urns)
+        assert set(posts) == {"urn:li:activity:1"}
+        assert empty == {}
+        assert sum("FROM person_profiles" in sql for sql in statements) == 3
+        assert sum("FROM post_cache" in sql for sql in statements) == 1
+
 
 class TestGetPreview:
     """Test get_preview function."""
@@ -244,3 +353,61 @@ class TestGetPreview:
             preview = get_preview(conn, item)
 
         assert "from Mike" in preview
+
+
+class TestLoadMetadata:
+    """Test metadata JSON decoding for Item rows."""
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            '{"resource_name": "ugcPosts", "raw": {"actor": "urn:li:person:a"}}',
+            '{"big": 123456789012345678901234567890, "emoji": "\\ud83d\\ude00"}',
+            '{"lone": "\\ud800"}',
+        ],
+    )
+    def test_matches_stdlib_json(self, raw):
+        import json
+
+        from lestash.models.item import load_metadata
+
+        assert load_metadata(raw) == json.loads(raw)
+
+
+class TestPreviewFromRow:
+    """Test the validation-free Item.preview_from_row constructor."""
+
+    def test_matches_from_row_for_displayed_fields(self, test_db):
+        from lestash.core.database import upsert_item
+        from lestash.models.item import ItemCreate
+
+        with get_connection(test_db) as conn:
+            upsert_item(
+                conn,
+                ItemCreate(
+                    source_type="linkedin",
+                    source_id="p1",
+                    title="Title",
+                    content="Body",
+                    author="urn:li:person:a",
+                    created_at=datetime(2025, 1, 2, 3, 4),
+                    metadata={"resource_name": "ugcPosts"},
+                ),
+            )
+            row = conn.execute("SELECT * FROM items").fetchone()
+
+        fast = Item.preview_from_row(row)
+        full = Item.from_row(row)
+        for field in ("id", "source_type", "title", "content", "author", "metadata"):
+            assert getattr(fast, field) == getattr(full, field)
+        assert fast.created_at == full.created_at
+        assert fast.fetched_at == full.fetched_at
+
+    def test_accepts_partial_rows_and_bad_timestamps(self):
+        row = {"id": 7, "source_type": "bluesky", "content": "x", "created_at": "not a date"}
+
+        item = Item.preview_from_row(row)
+
+        assert item.id == 7
+        assert item.created_at is None
+        assert item.metadata is None
@@ -0,0 +1,75 @@
+"""Tests for plugin command registration in the main CLI."""
+
+import pytest
+import typer
+from lestash.cli.main import app
+from lestash.plugins.loader import load_plugins
+
+
+class _FakePlugin:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+
+    def get_commands(self) -> typer.Typer:
+        if self.fail:
+            raise RuntimeError("broken plugin")
+        plugin_app = typer.Typer(help="Fake source commands.")
+
+        @plugin_app.command()
+        def hello() -> None:
+            """Say hello."""
+
+        return plugin_app
+
+
+class TestLazyPluginCommands:
+    @pytest.fixture
+    def loaded(self, monkeypatch):
+        """Install a fake 'fake' plugin and record which plugins get imported."""
+        calls: list = []
+        plugins = {"fake": _FakePlugin(), "broken": _FakePlugin(fail=True)}
+
+        def fake_load_plugins(names=None):
+            calls.append(names)
+            return {name: plugins[name] for name in names or plugins if name in plugins}
+
+        monkeypatch.setattr("lestash.cli.main.plugin_names", lambda: list(plugins))
+        monkeypatch.setattr("lestash.cli.main.load_plugins", fake_load_plugins)
+        return calls
+
+    @pytest.fixture
+    def ctx(self):
+        return typer.Context(typer.main.get_command(app))
+
+    def test_lists_plugins_without_importing_them(self, loaded, ctx):
+        commands = ctx.command.list_commands(ctx)
+        assert commands[0] == "items"
+        assert commands[-2:] == ["fake", "broken"]
+        assert loaded == []
+
+    def test_core_commands_skip_plugins(self, loaded, ctx):
+        assert ctx.command.get_command(ctx, "items") is not None
+        assert ctx.command.get_command(ctx, "no-such-command") is None
+        assert loaded == []
+
+    def test_plugin_loaded_on_first_lookup(self, loaded, ctx):
+        command = ctx.command.get_command(ctx, "fake")
+        assert command.name == "fake"
+        assert "hello" in command.list_commands(ctx)
+        assert ctx.command.get_command(ctx, "fake") is command
+        assert loaded == [["fake"]]
+
+    def test_broken_plugin_is_skipped(self, loaded, ctx):
+        assert ctx.command.get_command(ctx, "broken") is None
+
+
+class TestLoadPlugins:
+    def test_names_filter_skips_other_plugins(self):
+        assert load_plugins([]) == {}
+        assert load_plugins(["no-such-plugin"]) == {}
+
+    def test_reuses_loaded_plugin_instances(self):
+        first = load_plugins()
+        again = load_plugins(list(first))
+        assert again.keys() == first.keys()
+        assert all(again[name] is first[name] for name in first)
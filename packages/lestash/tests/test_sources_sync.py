@@ -0,0 +1,145 @@
+"""Tests for the batched item writes used by `sources sync`."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+import typer
+from lestash.cli.sources import _prefetch, _store_items, app
+from lestash.core.database import get_connection
+from lestash.models.item import ItemCreate, MediaCreate
+from lestash.plugins.base import SourcePlugin
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def _item(n: int, **kwargs) -> ItemCreate:
+    return ItemCreate(source_type="test", source_id=f"id-{n}", content=f"item {n}", **kwargs)
+
+
+def test_stores_items_across_batches(test_db) -> None:
+    with get_connection(test_db) as conn:
+        assert _store_items(conn, (_item(n) for n in range(7)), batch_size=3) == (7, 0)
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 7
+
+
+def test_resync_updates_in_place(test_db) -> None:
+    with get_connection(test_db) as conn:
+        assert _store_items(conn, [_item(1, metadata={"v": 1})]) == (1, 0)
+        resync = [_item(1, title="Updated", metadata={"v": 2}), _item(2)]
+        assert _store_items(conn, resync) == (1, 1)
+        rows = conn.execute("SELECT title, metadata FROM items ORDER BY id").fetchall()
+        assert [(r["title"], r["metadata"]) for r in rows] == [
+            ("Updated", '{"v": 2}'),
+            (None, None),
+        ]
+
+
+def test_attaches_media_once(test_db) -> None:
+    media = [MediaCreate(media_type="image", url="https://example.com/a.png")]
+    with get_connection(test_db) as conn:
+        _store_items(conn, [_item(1, media=media), _item(2)], batch_size=1)
+        _store_items(conn, [_item(1, media=media)])
+        rows = conn.execute(
+            "SELECT i.source_id, m.url FROM item_media m JOIN items i ON i.id = m.item_id"
+        ).fetchall()
+        assert [tuple(r) for r in rows] == [("id-1", "https://example.com/a.png")]
+
+
+def test_plugin_error_survives_failed_flush(test_db) -> None:
+    def failing_sync() -> Iterator[ItemCreate]:
+        yield _item(1)
+        raise RuntimeError("feed unavailable")
+
+    with (
+        get_connection(test_db) as conn,
+        patch(
+            "lestash.core.database.upsert_items_batch",
+            side_effect=sqlite3.OperationalError("database is locked"),
+        ),
+        pytest.raises(RuntimeError, match="feed unavailable") as excinfo,
+    ):
+        _store_items(conn, failing_sync())
+    assert isinstance(excinfo.value.__cause__, sqlite3.OperationalError)
+
+
+def test_status_lists_sync_history(test_db) -> None:
+    with patch("lestash.cli.sources.Config.load", return_value=test_db):
+        assert "No sync history" in runner.invoke(app, ["status"]).output
+
+        with get_connection(test_db) as conn:
+            conn.execute(
+                "INSERT INTO sync_log (source_type, started_at, status, items_added) "
+                "VALUES ('test', '2026-01-02 03:04:05', 'completed', 3)"
+            )
+            conn.commit()
+        result = runner.invoke(app, ["status"])
+
+    assert result.exit_code == 0
+    assert "2026-01-02 03:04" in result.output
+    assert "completed" in result.output
+    assert "+3" in result.output
+
+
+class _FakePlugin(SourcePlugin):
+    description = "Fake source for tests"
+
+    def __init__(self, name: str, count: int, fail: bool = False) -> None:
+        self.name = name
+        self.count = count
+        self.fail = fail
+
+    def get_commands(self) -> typer.Typer:
+        return typer.Typer()
+
+    def sync(self, config: dict) -> Iterator[ItemCreate]:
+        for n in range(self.count):
+            yield ItemCreate(source_type=self.name, source_id=str(n), content=f"{self.name} {n}")
+        if self.fail:
+            raise RuntimeError("feed unavailable")
+
+
+def test_sync_all_runs_sources_concurrently(test_db) -> None:
+    plugins = {
+        "alpha": _FakePlugin("alpha", 3),
+        "beta": _FakePlugin("beta", 2),
+        "gamma": _FakePlugin("gamma", 1, fail=True),
+    }
+    with (
+        patch("lestash.cli.sources.Config.load", return_value=test_db),
+        patch("lestash.cli.sources.load_plugins", return_value=plugins),
+    ):
+        result = runner.invoke(app, ["sync", "--all"])
+
+    assert result.exit_code == 0
+    assert "Synced alpha: 3 items added" in result.output
+    assert "Error syncing gamma: feed unavailable" in result.output
+    with get_connection(test_db) as conn:
+        log = dict(conn.execute("SELECT source_type, status FROM sync_log").fetchall())
+        assert log == {"alpha": "completed", "beta": "completed", "gamma": "failed"}
+        synced = dict(conn.execute("SELECT source_type, last_sync FROM sources").fetchall())
+        assert synced.keys() == {"alpha", "beta"}
+        # Items written before the failure are kept
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 6
+
+
+class TestPrefetch:
+    def test_yields_items_in_order(self) -> None:
+        assert list(_prefetch(iter(range(50)), maxsize=4)) == list(range(50))
+
+    def test_reraises_after_yielded_items(self) -> None:
+        received = []
+        with pytest.raises(RuntimeError, match="feed unavailable"):
+            for item in _prefetch(_FakePlugin("alpha", 3, fail=True).sync({})):
+                received.append(item.source_id)
+        assert received == ["0", "1", "2"]
+
+    def test_consumer_can_stop_early(self) -> None:
+        prefetched = _prefetch(iter(range(1000)), maxsize=2)
+        assert next(prefetched) == 0
+        prefetched.close()